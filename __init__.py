@@ -1,42 +1,338 @@
 import bpy
 import bmesh
-from bpy.types import Operator, Menu, Panel, UIList
-from bpy.app.handlers import depsgraph_update_post
+import cProfile
+import fnmatch
+import functools
+import hashlib
+import io
+import json
+import os
+import pstats
+import tempfile
+import time
+import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from bpy.types import Operator, Menu, Panel, UIList, AddonPreferences
+from mathutils.bvhtree import BVHTree
+from . import batch
+from bpy.app.handlers import depsgraph_update_post, load_post, undo_post, redo_post, persistent
 
-copied_uv_data = {}
-_sync_state = {}
+_sync_state = OrderedDict()
+_name_cache = {}
+_topology_cache = {}
+_uv_flags = {}
+_msgbus_owner = object()
+_batch = None
+_selection = None
+_profile = None
+_profile_log = deque(maxlen=50)
+_clipboard = None
+_uv_stats = {}
+_stats_fresh = {}
+_stats_queue = {}
+_stats_jobs = {}
+_stats_pool = None
+
+EMPTY_CHUNK = 1 << 16
+EMPTY_PROBE = 32
+PROJECT_NUDGE = 1e-3
+SYNC_STATE_LIMIT = 256
+# UI list flag bits, below UIList.bitflag_filter_item (1 << 30)
+FLAG_EMPTY, FLAG_RENDER, FLAG_LOCKED = 1 << 0, 1 << 1, 1 << 2
+# Spans and face areas below this count as collapsed when flagging degenerate UV maps
+STATS_EPS = 1e-6
+# Statistics timer: main-thread time per call for reading maps, maps hashed at once off the main thread, poll interval
+STATS_SLICE = 0.01
+STATS_JOBS = 2
+STATS_INTERVAL = 0.05
+SHOW_FLAGS = {'EMPTY': FLAG_EMPTY, 'RENDER': FLAG_RENDER, 'LOCKED': FLAG_LOCKED}
+PROFILE_TIMERS = ('backup', 'rebuild', 'update', 'redraw')
+MODAL_MIN_MESHES = 50
+MODAL_SLICE = 0.05
+# Clipboard files in the add-on's user directory: header, UV rows (layers x corners*2) and captured corner indices
+CLIPBOARD_FILES = ('clipboard.json', 'clipboard_uv.npy', 'clipboard_corners.npy')
+MODAL_PASS = {'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM', 'TIMER_REPORT'}
 
 def get_meshes(ctx):
     return [o for o in ctx.selected_objects if o.type == 'MESH']
 
+def group_meshes(objs):
+    """Unique mesh datablocks of objs in selection order, mapped to how many of the objects use them"""
+    groups = {}
+    for o in objs:
+        groups[o.data] = groups.get(o.data, 0) + 1
+    return groups
+
+def selection_key(ctx):
+    """Cheap identity of the selection ctx describes, so scripted selections and temp_override are not served a stale summary"""
+    vl, obj = ctx.view_layer, ctx.object
+    return (vl.as_pointer() if vl else 0, len(ctx.selected_objects), obj.session_uid if obj else 0)
+
+def selection_summary(ctx):
+    """(mesh objects, unique meshes, any with more than 8 UV maps) of the selection, cached until the next depsgraph
+    update or until the view layer, the number of selected objects or the active object differ"""
+    global _selection
+    key = selection_key(ctx)
+    if _selection is None or _selection[0] != key:
+        objs = get_meshes(ctx)
+        groups = group_meshes(objs)
+        _selection = (key, (len(objs), len(groups), any(len(m.uv_layers) > 8 for m in groups)))
+    return _selection[1]
+
+@persistent
+def selection_changed(*args):
+    """Depsgraph updates cover selection and geometry changes; this only drops the summary, so playback stays cheap"""
+    global _selection
+    _selection = None
+
+def batch_groups(ctx):
+    """group_meshes of the selected mesh objects and the active object"""
+    objs = get_meshes(ctx)
+    return group_meshes(objs if ctx.object in objs else [ctx.object, *objs])
+
+def other_meshes(ctx):
+    return [m for m in group_meshes(get_meshes(ctx)) if m != ctx.object.data]
+
+def count_text(groups):
+    return f"{len(groups)} mesh(es), {sum(groups.values())} object(s)"
+
+def get_prefs():
+    addon = bpy.context.preferences.addons.get(__package__)
+    return addon.preferences if addon else None
+
+# === PROFILING ===
+
+@contextmanager
+def timed(key):
+    """Add the time spent in the block, minus nested timed blocks, to key of the running operator profile"""
+    rec = _profile
+    if rec is None:
+        yield
+        return
+    outer, rec['_nested'] = rec['_nested'], 0.0
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t
+        rec[key] += dt - rec['_nested']
+        rec['_nested'] = outer + dt
+
+def touched(mesh, layers):
+    """Count layers written on mesh toward the running operator profile"""
+    if _profile is not None:
+        _profile['_meshes'][mesh.as_pointer()] = len(mesh.loops)
+        _profile['layers'] += layers
+
+def write_profile(rec, prefs):
+    _profile_log.append(rec)
+    if prefs.profile_file:
+        try:
+            with open(bpy.path.abspath(prefs.profile_file), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(rec) + "\n")
+        except OSError as e:
+            print(f"UV Maps+: cannot write profile log: {e}")
+
+def save_cprofile(op, prof):
+    """Dump cProfile stats to the temp directory and print the top entries"""
+    path = os.path.join(tempfile.gettempdir(), f"uvmaps_plus_{op.bl_idname}.prof")
+    prof.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats('cumulative').print_stats(25)
+    print(out.getvalue())
+    op.report({'INFO'}, f"Profile saved to {path}")
+
+@contextmanager
+def profiling(rec):
+    """Attribute the time and work of the block to rec, which may span several calls (modal runs); None does nothing"""
+    global _profile
+    if rec is None:
+        yield
+        return
+    prof = rec.get('_cprofile')
+    _profile = rec
+    t = time.perf_counter()
+    if prof: prof.enable()
+    try:
+        yield
+    finally:
+        if prof: prof.disable()
+        _profile = None
+        rec['time'] += time.perf_counter() - t
+
+def finish_profile(op, rec):
+    prof = rec.pop('_cprofile', None)
+    if prof: save_cprofile(op, prof)
+    meshes = rec.pop('_meshes')
+    del rec['_nested']
+    rec.update(meshes=len(meshes), loops=sum(meshes.values()))
+    write_profile(rec, get_prefs())
+
+def profiled(execute):
+    """Record time and work of an operator's execute when profiling is enabled in the preferences.
+    If execute goes modal the record is left in op.profile_rec for the modal steps to finish"""
+    @functools.wraps(execute)
+    def wrapper(self, ctx):
+        prefs = get_prefs()
+        if _profile is not None or prefs is None or not (prefs.profile or prefs.profile_capture):
+            return execute(self, ctx)
+        rec = dict.fromkeys(PROFILE_TIMERS, 0.0)
+        rec.update(op=self.bl_idname, when=time.time(), time=0.0, layers=0, _nested=0.0, _meshes={})
+        if prefs.profile_capture:
+            prefs.profile_capture = False
+            rec['_cprofile'] = cProfile.Profile()
+        result = {'CANCELLED'}
+        try:
+            with profiling(rec):
+                result = execute(self, ctx)
+        finally:
+            if 'RUNNING_MODAL' in result: self.profile_rec = rec
+            else: finish_profile(self, rec)
+        return result
+    return wrapper
+
+def read_uv(layer, count):
+    if not hasattr(layer.data, 'foreach_get') or len(layer.data) != count: return None
+    buf = np.empty(count * 2, dtype=np.float32)
+    layer.data.foreach_get('uv', buf)
+    return buf
+
+class UVSnapshot(dict):
+    """Packed float32 UV buffers by layer name, read on first access. Never written in place, so duplicates share; None is all zeros"""
+    def __init__(self, mesh):
+        super().__init__()
+        self.mesh = mesh
+    def __missing__(self, name):
+        with timed('backup'):
+            layer = self.mesh.uv_layers.get(name)
+            buf = self[name] = read_uv(layer, len(self.mesh.loops)) if layer else None
+        return buf
+
 def get_uv_backup(mesh):
-    backup, n = {}, len(mesh.loops) * 2
-    for layer in mesh.uv_layers:
-        c = [0.0] * n
-        if hasattr(layer.data, 'foreach_get') and len(layer.data) == len(mesh.loops):
-            layer.data.foreach_get('uv', c)
-        backup[layer.name] = c
-    return backup
+    return UVSnapshot(mesh)
+
+def reorder_window(old, new):
+    """Slice [start, end) of slots that differ between two equal-length name orders (common prefix and suffix trimmed)"""
+    start, end = 0, len(new)
+    while start < end and old[start] == new[start]: start += 1
+    while end > start and old[end-1] == new[end-1]: end -= 1
+    return start, end
 
 def rebuild_uvs(mesh, names, backup, idx):
-    render = next((l.name for l in mesh.uv_layers if l.active_render), None)
-    while mesh.uv_layers:
-        mesh.uv_layers.remove(mesh.uv_layers[0])
-    for name in names:
+    """Match the UV layers of mesh to names; only slots that end up holding a different layer are rewritten"""
+    with timed('rebuild'):
+        _rebuild_uvs(mesh, names, backup, idx)
+    tag_update(mesh)
+
+def _rebuild_uvs(mesh, names, backup, idx):
+    layers, n = mesh.uv_layers, len(mesh.loops)
+    render = next((l.name for l in layers if l.active_render), None)
+    keep = set(names)
+    # Removing a layer shifts the ones after it, so each is looked up again by name
+    for name in [l.name for l in layers if l.name not in keep]:
+        layers.remove(layers[name])
+    have = {l.name for l in layers}
+    added = [name for name in names if name not in have]
+    for name in added:
         attr = mesh.attributes.new(name=name, type='FLOAT2', domain='CORNER')
-        if name in backup and backup[name]:
+        if backup[name] is not None:
             attr.data.foreach_set('vector', backup[name])
-    if render in names and render in mesh.uv_layers:
-        mesh.uv_layers[render].active_render = True
-    if names and 0 <= idx < len(mesh.uv_layers):
-        mesh.uv_layers.active_index = idx
-    mesh.update()
-    for area in bpy.context.screen.areas:
-        area.tag_redraw()
+    cur = [l.name for l in layers]
+    start, end = reorder_window(cur, names)
+    slots = [k for k in range(start, end) if cur[k] != names[k]]
+    touched(mesh, len(added) + len(slots))
+    data = {names[k]: backup[names[k]] for k in slots}
+    for k in slots:
+        layers[k].name = f"__uvmp_tmp{k}"
+    for k in slots:
+        layers[k].name = names[k]
+        buf = data[names[k]]
+        layers[k].data.foreach_set('uv', buf if buf is not None else np.zeros(n * 2, dtype=np.float32))
+    if render in names and render in layers:
+        layers[render].active_render = True
+    if names and 0 <= idx < len(layers):
+        layers.active_index = idx
+
+def tag_redraw():
+    if bpy.context.screen:
+        with timed('redraw'):
+            for area in bpy.context.screen.areas:
+                area.tag_redraw()
+
+def tag_update(mesh):
+    _name_cache.pop(mesh.as_pointer(), None)
+    _uv_flags.pop(mesh.as_pointer(), None)
+    selection_changed()
+    if bpy.context.object and bpy.context.object.data == mesh:
+        remember_state(bpy.context.object)
+    if _batch is not None:
+        _batch.setdefault(mesh.as_pointer(), mesh)
+        return
+    with timed('update'):
+        mesh.update()
+    tag_redraw()
+
+@contextmanager
+def uv_batch():
+    """Collect the meshes changed inside the block and update each once, with a single redraw, on exit"""
+    global _batch
+    if _batch is not None:
+        yield
+        return
+    _batch = {}
+    try:
+        yield
+    finally:
+        meshes, _batch = _batch, None
+        with timed('update'):
+            for mesh in meshes.values():
+                mesh.update()
+        if meshes:
+            tag_redraw()
 
 def is_uv_selected(loop, uv_layer):
     return loop.uv_select_vert if hasattr(loop, 'uv_select_vert') else loop[uv_layer].select
 
+def selected_corners(obj):
+    """Indices (int32) of the UV-selected corners of the active layer in Edit Mode, after syncing the mesh from the edit mesh"""
+    obj.update_from_editmode()
+    mesh = obj.data
+    layer, n = mesh.uv_layers.active, len(mesh.loops)
+    sel = np.zeros(n, dtype=bool)
+    flags = getattr(layer, 'vertex_selection', None)
+    if flags is not None and len(flags) == n:
+        flags.foreach_get('value', sel)
+    else:
+        # UV selection is not exposed as a mesh attribute in this Blender version, read it from the BMesh
+        bm = bmesh.from_edit_mesh(mesh)
+        uv = bm.loops.layers.uv.active
+        sel[:] = [is_uv_selected(l, uv) for f in bm.faces for l in f.loops]
+    return np.flatnonzero(sel).astype(np.int32)
+
+def write_uv_selection(obj, idx, layers):
+    """Write (name, UVs N x 2) pairs to the given corner indices in Edit Mode, visiting only the faces they belong to.
+    A name of None is the active layer, missing names are added to the edit mesh"""
+    obj.update_from_editmode()
+    mesh = obj.data
+    start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', start)
+    face = np.searchsorted(start, idx, side='right') - 1
+    corner = (idx - start[face]).tolist()
+    face = face.tolist()
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    faces, uv_layers = bm.faces, bm.loops.layers.uv
+    for name, uvs in layers:
+        uv = uv_layers.active if name is None else uv_layers.get(name) or uv_layers.new(name)
+        for f, c, co in zip(face, corner, np.asarray(uvs).tolist()):
+            faces[f].loops[c][uv].uv = co
+        touched(mesh, 1)
+    with timed('update'):
+        bmesh.update_edit_mesh(mesh)
+    return len(idx)
+
 def available_name(objects, base="UVMap"):
     used = {l.name for o in objects for l in o.data.uv_layers}
     if base not in used: return base
@@ -44,73 +340,547 @@ def available_name(objects, base="UVMap"):
     while f"{base}.{i:03d}" in used: i += 1
     return f"{base}.{i:03d}"
 
-def ensure_uv(mesh, name):
-    if name not in [l.name for l in mesh.uv_layers]:
+def uv_digests(mesh, backup):
+    """(name, 128-bit hash of the packed UVs) of each UV layer of mesh that could be read, in slot order"""
+    return [(l.name, hashlib.blake2b(backup[l.name].tobytes(), digest_size=16).digest())
+            for l in mesh.uv_layers if backup[l.name] is not None]
+
+def is_uv_empty(layer, count, eps=0.0, degenerate=False):
+    """True if every UV of layer lies within eps of (0,0), or of its first UV when degenerate.
+    Past EMPTY_CHUNK corners a strided sample is checked one by one first, so most used maps skip the bulk read"""
+    if len(layer.data) != count: return False
+    if not count: return True
+    ref = np.array(layer.data[0].uv if degenerate else (0.0, 0.0), dtype=np.float32)
+    step = count // EMPTY_PROBE if count > EMPTY_CHUNK else count
+    for k in range(0, count, step):
+        if np.abs(np.array(layer.data[k].uv, dtype=np.float32) - ref).max() > eps: return False
+    uv = read_uv(layer, count).reshape(-1, 2)
+    # Compared in chunks to keep the temporary difference array small
+    for i in range(0, count, EMPTY_CHUNK):
+        if np.abs(uv[i:i+EMPTY_CHUNK] - ref).max() > eps: return False
+    return True
+
+def ensure_uvs(mesh, names):
+    """Append the missing names as empty UV maps in one rebuild (existing slots are not rewritten), return how many"""
+    cur = [l.name for l in mesh.uv_layers]
+    have = set(cur)
+    missing = [n for n in dict.fromkeys(names) if n not in have]
+    if missing:
         b = get_uv_backup(mesh)
-        n = [l.name for l in mesh.uv_layers] + [name]
-        b[name] = [0.0] * (len(mesh.loops) * 2)
-        rebuild_uvs(mesh, n, b, mesh.uv_layers.active_index if mesh.uv_layers else 0)
+        for name in missing: b[name] = None
+        rebuild_uvs(mesh, cur + missing, b, mesh.uv_layers.active_index if mesh.uv_layers else 0)
+    return len(missing)
+
+def ensure_uv(mesh, name):
+    ensure_uvs(mesh, [name])
+
+# === CLIPBOARD ===
+# Copied UV maps live on disk, so they survive restarts and paste into other sessions and files.
+# Both ends memory-map the UV rows and go one layer at a time, so no side holds the whole copy in RAM.
+
+def clipboard_path(i, create=False):
+    return os.path.join(bpy.utils.extension_path_user(__package__, path="clipboard", create=create), CLIPBOARD_FILES[i])
+
+def clipboard_header():
+    """Header of the clipboard on disk or None, re-read only when the file changes (another session may write it)"""
+    global _clipboard
+    try:
+        stamp = os.stat(clipboard_path(0)).st_mtime_ns
+        if _clipboard is None or _clipboard[0] != stamp:
+            with open(clipboard_path(0), encoding='utf-8') as f:
+                _clipboard = (stamp, json.load(f))
+    except (OSError, ValueError):
+        return None
+    return _clipboard[1]
+
+def copy_to_clipboard(mesh, names, corners=None):
+    """Write the named UV maps of mesh, whole or only at corners, to the clipboard and return its header.
+    Files are replaced, header last, so a reader sees the old or the new copy; raises OSError"""
+    n = len(mesh.loops)
+    size = n if corners is None else len(corners)
+    tmp = [clipboard_path(i, create=True) + '.tmp' for i in range(3)]
+    out = np.lib.format.open_memmap(tmp[1], mode='w+', dtype=np.float32, shape=(len(names), size * 2))
+    for i, name in enumerate(names):
+        uvs = read_uv(mesh.uv_layers[name], n)
+        if uvs is None:
+            out[i] = 0
+        else:
+            out[i] = uvs if corners is None else uvs.reshape(-1, 2)[corners].ravel()
+    out.flush()
+    del out
+    header = {'source': mesh.name, 'names': names, 'size': size, 'loops': n, 'topology': topology_key(mesh), 'corners': corners is not None}
+    if corners is not None:
+        with open(tmp[2], 'wb') as f:
+            np.save(f, np.asarray(corners, dtype=np.int32), allow_pickle=False)
+        os.replace(tmp[2], clipboard_path(2))
+    os.replace(tmp[1], clipboard_path(1))
+    with open(tmp[0], 'w', encoding='utf-8') as f:
+        json.dump(header, f)
+    os.replace(tmp[0], clipboard_path(0))
+    return header
+
+def load_clipboard():
+    """(header, UV rows, corner indices or None) with the arrays memory-mapped read-only, or None if empty or mid-write"""
+    header = clipboard_header()
+    if header is None: return None
+    try:
+        uvs = np.load(clipboard_path(1), mmap_mode='r', allow_pickle=False)
+        corners = np.load(clipboard_path(2), mmap_mode='r', allow_pickle=False) if header['corners'] else None
+    except (OSError, ValueError):
+        return None
+    if uvs.shape != (len(header['names']), header['size'] * 2) or (corners is not None and len(corners) != header['size']):
+        return None
+    return header, uvs, corners
+
+def paste_from_clipboard(mesh, uvs, corners, rows):
+    """Write clipboard rows into mesh in Object Mode, rows as (row index, UV map name); missing maps are added"""
+    ensure_uvs(mesh, [name for _, name in rows])
+    n = len(mesh.loops)
+    for i, name in rows:
+        data = mesh.uv_layers[name].data
+        if corners is None:
+            data.foreach_set('uv', uvs[i])
+        else:
+            buf = read_uv(mesh.uv_layers[name], n)
+            buf.reshape(-1, 2)[corners] = uvs[i].reshape(-1, 2)
+            data.foreach_set('uv', buf)
+        touched(mesh, 1)
+    tag_update(mesh)
+
+def match_names(names, patterns):
+    """names matching any of the comma separated wildcard patterns, all of them if there are none"""
+    pats = [p.strip() for p in patterns.split(',') if p.strip()]
+    return [n for n in names if not pats or any(fnmatch.fnmatchcase(n, p) for p in pats)]
+
+# === TOPOLOGY ===
+
+def topology_key(mesh):
+    """Hash of face sizes and loop -> vertex indices, cached by session_uid until a geometry update of the mesh
+    (uv_data_changed), a mode change or a change of element counts; never cached in Edit Mode"""
+    uid = mesh.session_uid
+    counts = (len(mesh.vertices), len(mesh.loops), len(mesh.polygons))
+    hit = _topology_cache.get(uid)
+    if hit and hit[0] == counts and not mesh.is_editmode: return hit[1]
+    verts = np.empty(counts[1], dtype=np.int32)
+    sizes = np.empty(counts[2], dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', verts)
+    mesh.polygons.foreach_get('loop_total', sizes)
+    h = hashlib.blake2b(np.array(counts, dtype=np.int64).tobytes(), digest_size=16)
+    h.update(sizes.tobytes())
+    h.update(verts.tobytes())
+    key = h.hexdigest()
+    if not mesh.is_editmode: _topology_cache[uid] = (counts, key)
+    return key
+
+def group_topology(meshes):
+    """Meshes grouped by topology_key, in order"""
+    groups = {}
+    for m in meshes:
+        groups.setdefault(topology_key(m), []).append(m)
+    return groups
+
+def on_mode_change():
+    """Topology can change in Edit Mode without changing element counts"""
+    _topology_cache.clear()
 
 # === TRANSFER ===
 
-def transfer_uv(src, tgt, name):
-    if len(src.loops) != len(tgt.loops): return False
+def transfer_uv(src, tgt, name, backup=None):
+    if topology_key(src) != topology_key(tgt): return False
     s, t = src.uv_layers.get(name), tgt.uv_layers.get(name)
     if not s or not t: return False
-    c = [0.0] * (len(src.loops) * 2)
-    s.data.foreach_get('uv', c)
+    c = backup[name] if backup is not None else read_uv(s, len(src.loops))
+    if c is None: return False
     t.data.foreach_set('uv', c)
+    touched(tgt, 1)
     return True
 
-# === SYNC HANDLER ===
+class UVProjector:
+    """Nearest-surface UV lookup on a source object, built once and reused for every target"""
+    def __init__(self, obj, snap=None):
+        mesh = obj.data
+        mesh.calc_loop_triangles()
+        n = len(mesh.loop_triangles)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        tris = np.empty(n * 3, dtype=np.int32)
+        loops = np.empty(n * 3, dtype=np.int32)
+        mesh.vertices.foreach_get('co', co)
+        mesh.loop_triangles.foreach_get('vertices', tris)
+        mesh.loop_triangles.foreach_get('loops', loops)
+        co, tris = co.reshape(-1, 3), tris.reshape(-1, 3)
+        self.tri_co = co[tris].astype(np.float64)
+        self.tri_loops = loops.reshape(-1, 3)
+        self.bvh = BVHTree.FromPolygons(co.tolist(), tris.tolist()) if n else None
+        self.matrix = obj.matrix_world.inverted()
+        self.snap = snap if snap is not None else get_uv_backup(mesh)
+
+    def weights(self, obj):
+        """Source triangle and barycentric weights for every corner of obj, or None without a source surface"""
+        if self.bvh is None: return None
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        verts = np.empty(len(mesh.loops), dtype=np.int32)
+        start = np.empty(len(mesh.polygons), dtype=np.int32)
+        total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.vertices.foreach_get('co', co)
+        mesh.loops.foreach_get('vertex_index', verts)
+        mesh.polygons.foreach_get('loop_start', start)
+        mesh.polygons.foreach_get('loop_total', total)
+        pos = co.reshape(-1, 3)[verts].astype(np.float64)
+        if len(start):
+            # Pull corners slightly toward their face center so UV seams resolve to the right side
+            centers = np.add.reduceat(pos, start) / total[:, None]
+            pos += (np.repeat(centers, total, axis=0) - pos) * PROJECT_NUDGE
+        m = np.array(self.matrix @ obj.matrix_world, dtype=np.float64)
+        pos = pos @ m[:3, :3].T + m[:3, 3]
+        find = self.bvh.find_nearest
+        hits = [find(p) for p in pos.tolist()]
+        tri = np.fromiter((h[2] if h[2] is not None else 0 for h in hits), dtype=np.int64, count=len(hits))
+        loc = np.array([h[0] if h[0] is not None else (0.0, 0.0, 0.0) for h in hits], dtype=np.float64).reshape(-1, 3)
+        a, b, c = self.tri_co[tri, 0], self.tri_co[tri, 1], self.tri_co[tri, 2]
+        v0, v1, v2 = b - a, c - a, loc - a
+        d00, d01, d11 = (v0 * v0).sum(1), (v0 * v1).sum(1), (v1 * v1).sum(1)
+        d20, d21 = (v2 * v0).sum(1), (v2 * v1).sum(1)
+        denom = d00 * d11 - d01 * d01
+        ok = denom > 1e-30
+        denom[~ok] = 1.0
+        v = np.where(ok, (d11 * d20 - d01 * d21) / denom, 0.0)
+        w = np.where(ok, (d00 * d21 - d01 * d20) / denom, 0.0)
+        return tri, np.stack([1.0 - v - w, v, w], axis=1)
+
+    def sample(self, name, tri, weights):
+        """Interpolated UVs of source layer name at the given triangles and weights, packed float32"""
+        buf = self.snap[name]
+        if buf is None: return np.zeros(len(tri) * 2, dtype=np.float32)
+        uv = buf.reshape(-1, 2)[self.tri_loops[tri]]
+        return (uv * weights[:, :, None]).sum(axis=1).astype(np.float32).ravel()
+
+# === UV LIST ===
+
+def uv_flags(mesh):
+    """FLAG_* bits of each UV layer of mesh by slot, cached until the mesh data or its render map changes"""
+    key = mesh.as_pointer()
+    flags = _uv_flags.get(key)
+    if flags is None or len(flags) != len(mesh.uv_layers):
+        n = len(mesh.loops)
+        flags = _uv_flags[key] = [
+            (FLAG_EMPTY if is_uv_empty(l, n) else 0) | (FLAG_RENDER if l.active_render else 0) | (FLAG_LOCKED if i >= 8 else 0)
+            for i, l in enumerate(mesh.uv_layers)]
+    return flags
+
+@persistent
+def uv_data_changed(scene, depsgraph):
+    """Drop the UV list flags and statistics of updated meshes, and the cached topology of those with new geometry"""
+    if not (_uv_flags or _stats_fresh or _topology_cache) or not depsgraph.id_type_updated('MESH'): return
+    for update in depsgraph.updates:
+        data = update.id.original
+        if isinstance(data, bpy.types.Object): data = data.data
+        if not isinstance(data, bpy.types.Mesh): continue
+        _uv_flags.pop(data.as_pointer(), None)
+        _stats_fresh.pop(data.session_uid, None)
+        # Geometry nodes, bmesh.to_mesh or scripts can reorder corners without changing element counts
+        if update.is_updated_geometry: _topology_cache.pop(data.session_uid, None)
+
+# === UV STATISTICS ===
+# Shown in the UV map list and cached per mesh (session_uid) and map with a hash of the UVs, so after an
+# edit unchanged maps are only re-hashed. A timer reads queued maps on the main thread and a worker thread
+# hashes them and computes the statistics. _stats_fresh holds the names of each mesh's maps known current.
+
+def face_ranges(mesh):
+    start = np.empty(len(mesh.polygons), dtype=np.int32)
+    total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', start)
+    mesh.polygons.foreach_get('loop_total', total)
+    return start, total
+
+def uv_stats(uv, start, total):
+    """Statistics of packed UVs (N x 2) with faces given by loop start and total, vectorized:
+    bounds (u min, v min, u max, v max), share of UVs outside 0-1, degenerate flag (UVs collapsed to a point
+    or line, or most faces without UV area) and coverage (face UV area as a share of the 0-1 square, capped
+    at 1; overlaps count twice)"""
+    if not len(uv): return None
+    lo, hi = uv.min(0), uv.max(0)
+    outside = float(np.count_nonzero(((uv < 0) | (uv > 1)).any(1)) / len(uv))
+    uv = uv.astype(np.float64)
+    # Shoelace formula, each face's last corner wrapping to its first
+    nxt = np.arange(1, len(uv) + 1)
+    nxt[start + total - 1] = start
+    cross = uv[:, 0] * uv[nxt, 1] - uv[nxt, 0] * uv[:, 1]
+    area = np.abs(np.add.reduceat(cross, start)) * 0.5 if len(start) else np.zeros(0)
+    degenerate = bool((hi - lo).min() < STATS_EPS or np.count_nonzero(area < STATS_EPS) * 2 > len(area))
+    return {'bounds': (*lo.tolist(), *hi.tolist()), 'outside': outside, 'degenerate': degenerate, 'coverage': min(1.0, float(area.sum()))}
+
+def stats_job(buf, topo, faces, hit):
+    """(hash, statistics) of packed UVs, reusing hit when the hash matches; NumPy and hashlib only, safe off the main thread"""
+    h = hashlib.blake2b(topo.encode(), digest_size=16)
+    h.update(buf)
+    digest = h.digest()
+    if hit is not None and hit[0] == digest: return hit
+    return digest, uv_stats(buf.reshape(-1, 2), *faces)
+
+def prune_stats(mesh):
+    uid, names = mesh.session_uid, {l.name for l in mesh.uv_layers}
+    for key in [k for k in _uv_stats if k[0] == uid and k[1] not in names]:
+        del _uv_stats[key]
+
+def refresh_stats(mesh):
+    """Bring the cached statistics of every UV map of mesh up to date now, on the calling thread"""
+    uid, n = mesh.session_uid, len(mesh.loops)
+    prune_stats(mesh)
+    fresh = _stats_fresh.setdefault(uid, set())
+    faces = None
+    for l in mesh.uv_layers:
+        if l.name in fresh: continue
+        buf = read_uv(l, n)
+        if buf is None:
+            _uv_stats.pop((uid, l.name), None)
+        else:
+            if faces is None: faces = face_ranges(mesh)
+            _uv_stats[(uid, l.name)] = stats_job(buf, topology_key(mesh), faces, _uv_stats.get((uid, l.name)))
+        fresh.add(l.name)
+
+def stats_current(mesh):
+    fresh = _stats_fresh.get(mesh.session_uid, ())
+    return all(l.name in fresh for l in mesh.uv_layers)
+
+def queue_stats(mesh):
+    """Have the statistics timer bring mesh up to date, unless it already is"""
+    if stats_current(mesh): return
+    prune_stats(mesh)
+    _stats_queue.setdefault(mesh.session_uid, mesh)
+    if not bpy.app.timers.is_registered(stats_timer):
+        bpy.app.timers.register(stats_timer, first_interval=STATS_INTERVAL)
+
+def stats_submit(mesh):
+    """Read the next stale map of mesh that has no job yet and hand it to the worker; False when there is none"""
+    uid, n = mesh.session_uid, len(mesh.loops)
+    fresh = _stats_fresh.setdefault(uid, set())
+    for l in mesh.uv_layers:
+        key = (uid, l.name)
+        if l.name in fresh or key in _stats_jobs: continue
+        buf = read_uv(l, n)
+        if buf is None:
+            _uv_stats.pop(key, None)
+            fresh.add(l.name)
+            continue
+        # The job marks its map current in the set taken here; an edit meanwhile replaces the set, so the result
+        # is still shown but the map is read again
+        fut = _stats_pool.submit(stats_job, buf, topology_key(mesh), face_ranges(mesh), _uv_stats.get(key))
+        _stats_jobs[key] = (fut, fresh)
+        return True
+    return False
+
+def stats_timer():
+    """Collect finished statistics and read queued maps for up to STATS_SLICE seconds, keeping at most STATS_JOBS
+    in flight. Redraws the Properties editor when statistics arrive"""
+    global _stats_pool
+    if _stats_pool is None: _stats_pool = ThreadPoolExecutor(1, thread_name_prefix="uvmaps_plus_stats")
+    arrived = False
+    for key in [k for k, (fut, _) in _stats_jobs.items() if fut.done()]:
+        fut, fresh = _stats_jobs.pop(key)
+        _uv_stats[key] = fut.result()
+        fresh.add(key[1])
+        arrived = True
+    deadline = time.perf_counter() + STATS_SLICE
+    while _stats_queue and len(_stats_jobs) < STATS_JOBS and time.perf_counter() < deadline:
+        uid, mesh = next(iter(_stats_queue.items()))
+        try:
+            if stats_submit(mesh): continue
+        except ReferenceError:
+            pass
+        del _stats_queue[uid]
+    if arrived:
+        # Timers run without a screen in the context, so tag_redraw() would not reach any area
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'PROPERTIES': area.tag_redraw()
+    return STATS_INTERVAL if _stats_queue or _stats_jobs else None
+
+def stop_stats():
+    global _stats_pool
+    _stats_queue.clear()
+    _stats_jobs.clear()
+    if _stats_pool is not None:
+        _stats_pool.shutdown(wait=False, cancel_futures=True)
+        _stats_pool = None
 
-def sync_handler(scene, depsgraph):
+def stats_text(s):
+    u0, v0, u1, v1 = s['bounds']
+    lines = [f"Bounds: U {u0:.3f} to {u1:.3f}, V {v0:.3f} to {v1:.3f}",
+             f"Outside 0-1: {s['outside']:.1%} of UVs",
+             f"Coverage: about {s['coverage']:.0%} of the 0-1 square"]
+    if s['degenerate']: lines.append("Degenerate: UVs collapsed, or most faces have no UV area")
+    return "\n".join(lines)
+
+def on_render_changed():
+    _uv_flags.clear()
+    sync_uv_state()
+
+# === SYNC ===
+
+def uv_slots(mesh):
+    """Name -> slot index of the UV layers of mesh, cached until layers are renamed or rebuilt"""
+    key = mesh.as_pointer()
+    slots = _name_cache.get(key)
+    if slots is None or len(slots) != len(mesh.uv_layers):
+        slots = _name_cache[key] = {l.name: i for i, l in enumerate(mesh.uv_layers)}
+    return slots
+
+def uv_state(mesh):
+    """(active name, render name, layer names) of mesh"""
+    layers = mesh.uv_layers
+    return (
+        layers.active.name if layers.active else None,
+        next((l.name for l in layers if l.active_render), None),
+        tuple(l.name for l in layers),
+    )
+
+def remember_state(obj, state=None):
+    """Store the UV state of obj by session UID, evicting the least recently used entries past SYNC_STATE_LIMIT"""
+    if not obj or obj.type != 'MESH': return None
+    key = obj.session_uid
+    last = _sync_state.pop(key, None)
+    _sync_state[key] = state or uv_state(obj.data)
+    while len(_sync_state) > SYNC_STATE_LIMIT:
+        _sync_state.popitem(last=False)
+    return last
+
+def sync_uv_state():
     ctx = bpy.context
-    if not ctx.object or ctx.object.type != 'MESH' or ctx.object.mode != 'OBJECT': return
-    objs = get_meshes(ctx)
-    if len(objs) <= 1: return
-    
-    obj, mesh = ctx.object, ctx.object.data
-    if not mesh.uv_layers: return
+    obj = ctx.object
+    if not obj or obj.type != 'MESH' or obj.mode != 'OBJECT': return
+    if not obj.data.uv_layers: return
     
-    oid = id(obj)
-    cur = {
-        'active': mesh.uv_layers.active.name if mesh.uv_layers.active else None,
-        'render': next((l.name for l in mesh.uv_layers if l.active_render), None),
-        'names': [l.name for l in mesh.uv_layers]
-    }
+    cur = uv_state(obj.data)
+    last = remember_state(obj, cur)
+    if last is None or last == cur: return
+    (active, render, names), (last_active, last_render, last_names) = cur, last
     
-    if oid in _sync_state:
-        last = _sync_state[oid]
-        for o in objs:
-            if o == obj: continue
-            m = o.data
-            # Sync active
-            if cur['active'] and cur['active'] != last.get('active') and cur['active'] in [l.name for l in m.uv_layers]:
-                m.uv_layers.active = m.uv_layers[cur['active']]
-            # Sync render
-            if cur['render'] and cur['render'] != last.get('render') and cur['render'] in [l.name for l in m.uv_layers]:
-                m.uv_layers[cur['render']].active_render = True
-            # Sync renames
-            ln = last.get('names', [])
-            if len(ln) == len(cur['names']):
-                for old, new in zip(ln, cur['names']):
-                    if old != new and old in [l.name for l in m.uv_layers] and new not in [l.name for l in m.uv_layers]:
-                        m.uv_layers[old].name = new
-    
-    _sync_state[oid] = cur
+    for m in other_meshes(ctx):
+        slots = uv_slots(m)
+        # Sync active
+        if active and active != last_active and active in slots:
+            m.uv_layers.active_index = slots[active]
+        # Sync render
+        if render and render != last_render and render in slots:
+            m.uv_layers[slots[render]].active_render = True
+        # Sync renames
+        if len(last_names) == len(names):
+            for old, new in zip(last_names, names):
+                if old != new and old in slots and new not in slots:
+                    i = slots.pop(old)
+                    m.uv_layers[i].name = new
+                    slots[m.uv_layers[i].name] = i
+
+def on_uv_renamed():
+    _name_cache.clear()
+    sync_uv_state()
+
+def on_active_object():
+    remember_state(bpy.context.object)
+
+def subscribe_sync():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for key, notify in (
+        ((bpy.types.MeshUVLoopLayer, "name"), on_uv_renamed),
+        ((bpy.types.MeshUVLoopLayer, "active_render"), on_render_changed),
+        ((bpy.types.UVLoopLayers, "active_index"), sync_uv_state),
+        ((bpy.types.UVLoopLayers, "active"), sync_uv_state),
+        ((bpy.types.LayerObjects, "active"), on_active_object),
+        ((bpy.types.Object, "mode"), on_mode_change),
+    ):
+        bpy.msgbus.subscribe_rna(key=key, owner=_msgbus_owner, args=(), notify=notify)
+
+@persistent
+def reset_caches(*args):
+    """File load and undo/redo replace datablocks, so cached states and pointers are dropped"""
+    _sync_state.clear()
+    _name_cache.clear()
+    _topology_cache.clear()
+    _uv_flags.clear()
+    _uv_stats.clear()
+    _stats_fresh.clear()
+    _stats_queue.clear()
+    _stats_jobs.clear()
+    selection_changed()
+    subscribe_sync()
+    remember_state(bpy.context.object)
 
 # === BASE OPERATOR ===
 
 class UV_OT_base(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     def get_state(self, ctx, names, backup, idx): raise NotImplementedError()
+    def summary(self, ctx): raise NotImplementedError()
+    @profiled
     def execute(self, ctx):
         mesh = ctx.object.data
         names, backup, idx = [l.name for l in mesh.uv_layers], get_uv_backup(mesh), mesh.uv_layers.active_index
-        new_names, new_backup, new_idx = self.get_state(ctx, names, backup, idx)
-        rebuild_uvs(mesh, new_names, new_backup, new_idx)
+        with uv_batch():
+            new_names, new_backup, new_idx = self.get_state(ctx, names, backup, idx)
+            rebuild_uvs(mesh, new_names, new_backup, new_idx)
+        self.report(*self.summary(ctx))
+        return {'FINISHED'}
+
+def use_modal(ctx):
+    return not bpy.app.background and selection_summary(ctx)[0] >= MODAL_MIN_MESHES
+
+class UV_OT_chunked(Operator):
+    """Per-mesh batch operator: all at once from execute, or time-sliced from invoke on large selections (Esc stops)"""
+    bl_options = {'REGISTER', 'UNDO'}
+    modal_run = False
+    profile_rec = None
+    def prepare(self, ctx): raise NotImplementedError()
+    def step(self, ctx, item): raise NotImplementedError()
+    def summary(self, ctx): raise NotImplementedError()
+    def run(self, ctx, items):
+        for item in items:
+            try: self.step(ctx, item)
+            except ReferenceError: pass  # Mesh removed while running modal
+            self.done += 1
+    def finish(self, ctx):
+        level, msg = self.summary(ctx)
+        if self.done < len(self.items):
+            level, msg = {'WARNING'}, f"Cancelled after {self.done} of {len(self.items)} mesh(es). {msg}"
+        self.report(level, msg)
         return {'FINISHED'}
+    @profiled
+    def execute(self, ctx):
+        self.items, self.done = self.prepare(ctx), 0
+        if self.modal_run: return self.start(ctx)
+        with uv_batch():
+            self.run(ctx, self.items)
+        return self.finish(ctx)
+    def invoke(self, ctx, event):
+        self.modal_run = use_modal(ctx)
+        return self.execute(ctx)
+    def start(self, ctx):
+        wm = ctx.window_manager
+        self._timer = wm.event_timer_add(0.01, window=ctx.window)
+        wm.progress_begin(0, max(1, len(self.items)))
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    def modal(self, ctx, event):
+        if event.type == 'ESC': return self.stop(ctx)
+        if event.type in MODAL_PASS: return {'PASS_THROUGH'}
+        if event.type != 'TIMER': return {'RUNNING_MODAL'}
+        # Whole meshes per slice, so stopping between slices leaves every mesh either done or untouched
+        end = time.perf_counter() + MODAL_SLICE
+        with profiling(self.profile_rec), uv_batch():
+            while self.done < len(self.items):
+                self.run(ctx, self.items[self.done:self.done+1])
+                if time.perf_counter() > end: break
+        ctx.window_manager.progress_update(self.done)
+        ctx.workspace.status_text_set(f"{self.bl_label}: {self.done}/{len(self.items)} mesh(es), Esc to stop")
+        return self.stop(ctx) if self.done >= len(self.items) else {'RUNNING_MODAL'}
+    def stop(self, ctx):
+        wm = ctx.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        ctx.workspace.status_text_set(None)
+        result = self.finish(ctx)
+        if self.profile_rec: finish_profile(self, self.profile_rec)
+        return result
 
 # === OPERATORS ===
 
@@ -121,14 +891,15 @@ class UV_OT_add(UV_OT_base):
     @classmethod
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT'
     def get_state(self, ctx, names, backup, idx):
-        objs = get_meshes(ctx) or [ctx.object]
-        name = available_name(objs)
-        for o in objs:
-            if o != ctx.object:
-                ensure_uv(o.data, name)
+        name = available_name(get_meshes(ctx) or [ctx.object])
+        for m in other_meshes(ctx):
+            ensure_uv(m, name)
+        self.name, self.groups = name, batch_groups(ctx)
         names.append(name)
-        backup[name] = [0.0] * (len(ctx.object.data.loops) * 2)
+        backup[name] = None
         return names, backup, len(names) - 1
+    def summary(self, ctx):
+        return {'INFO'}, f"Added UV map '{self.name}' on {count_text(self.groups)}"
 
 class UV_OT_remove(UV_OT_base):
     bl_idname = "uv.remove_map"
@@ -138,15 +909,18 @@ class UV_OT_remove(UV_OT_base):
     def poll(cls, ctx): return ctx.object and ctx.object.data.uv_layers.active and ctx.object.mode == 'OBJECT'
     def get_state(self, ctx, names, backup, idx):
         name = names[idx]
-        for o in get_meshes(ctx):
-            if o != ctx.object and name in [l.name for l in o.data.uv_layers]:
-                b = get_uv_backup(o.data)
-                n = [l.name for l in o.data.uv_layers]
+        self.name, self.groups = name, {m: n for m, n in batch_groups(ctx).items() if name in m.uv_layers}
+        for m in other_meshes(ctx):
+            if name in m.uv_layers:
+                b = get_uv_backup(m)
+                n = [l.name for l in m.uv_layers]
                 i = n.index(name)
-                del b[name]; n.remove(name)
-                rebuild_uvs(o.data, n, b, min(i, len(n)-1) if n else -1)
-        del backup[name]; names.remove(name)
+                b.pop(name, None); n.remove(name)
+                rebuild_uvs(m, n, b, min(i, len(n)-1) if n else -1)
+        backup.pop(name, None); names.remove(name)
         return names, backup, min(idx, len(names)-1) if names else -1
+    def summary(self, ctx):
+        return {'INFO'}, f"Removed UV map '{self.name}' from {count_text(self.groups)}"
     def invoke(self, ctx, event):
         name = ctx.object.data.uv_layers.active.name
         if len([o for o in get_meshes(ctx) if name in [l.name for l in o.data.uv_layers]]) > 1:
@@ -161,19 +935,22 @@ class UV_OT_duplicate(UV_OT_base):
     def poll(cls, ctx): return ctx.object and ctx.object.data.uv_layers.active and ctx.object.mode == 'OBJECT'
     def get_state(self, ctx, names, backup, idx):
         orig = names[idx]
-        objs = [o for o in get_meshes(ctx) or [ctx.object] if orig in [l.name for l in o.data.uv_layers]]
+        objs = [o for o in get_meshes(ctx) or [ctx.object] if orig in o.data.uv_layers]
         new = available_name(objs, orig)
-        for o in objs:
-            if o != ctx.object:
-                b = get_uv_backup(o.data)
-                n = [l.name for l in o.data.uv_layers]
+        for m in group_meshes(objs):
+            if m != ctx.object.data:
+                b = get_uv_backup(m)
+                n = [l.name for l in m.uv_layers]
                 i = n.index(orig)
                 n.insert(i+1, new)
-                b[new] = b[orig][:]
-                rebuild_uvs(o.data, n, b, o.data.uv_layers.active_index)
+                b[new] = b[orig]
+                rebuild_uvs(m, n, b, m.uv_layers.active_index)
+        self.name, self.new, self.groups = orig, new, {m: n for m, n in batch_groups(ctx).items() if orig in m.uv_layers}
         names.insert(idx+1, new)
-        backup[new] = backup[orig][:]
+        backup[new] = backup[orig]
         return names, backup, idx+1
+    def summary(self, ctx):
+        return {'INFO'}, f"Duplicated UV map '{self.name}' as '{self.new}' on {count_text(self.groups)}"
 
 class UV_OT_move(Operator):
     bl_idname = "uv.move_map"
@@ -183,20 +960,24 @@ class UV_OT_move(Operator):
     direction: bpy.props.EnumProperty(items=[('UP','Up',''),('DOWN','Down',''),('TOP','Top',''),('BOTTOM','Bottom','')])
     @classmethod
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and len(ctx.object.data.uv_layers) > 1
+    @profiled
     def execute(self, ctx):
         name = ctx.object.data.uv_layers.active.name
-        for o in get_meshes(ctx) or [ctx.object]:
-            m = o.data
-            n = [l.name for l in m.uv_layers]
-            if name not in n: continue
-            i = n.index(name)
-            if self.direction == 'UP' and i > 0: t = i-1
-            elif self.direction == 'DOWN' and i < len(n)-1: t = i+1
-            elif self.direction == 'TOP' and i > 0: t = 0
-            elif self.direction == 'BOTTOM' and i < len(n)-1: t = len(n)-1
-            else: continue
-            n.insert(t, n.pop(i))
-            rebuild_uvs(m, n, get_uv_backup(m), t if o == ctx.object else m.uv_layers.active_index)
+        groups, moved = group_meshes(get_meshes(ctx) or [ctx.object]), {}
+        with uv_batch():
+            for m in groups:
+                n = [l.name for l in m.uv_layers]
+                if name not in n: continue
+                i = n.index(name)
+                if self.direction == 'UP' and i > 0: t = i-1
+                elif self.direction == 'DOWN' and i < len(n)-1: t = i+1
+                elif self.direction == 'TOP' and i > 0: t = 0
+                elif self.direction == 'BOTTOM' and i < len(n)-1: t = len(n)-1
+                else: continue
+                n.insert(t, n.pop(i))
+                rebuild_uvs(m, n, get_uv_backup(m), t if m == ctx.object.data else m.uv_layers.active_index)
+                moved[m] = groups[m]
+        self.report({'INFO'}, f"Moved UV map '{name}' {self.direction.lower()} on {count_text(moved)}")
         return {'FINISHED'}
 
 class UV_OT_sort(UV_OT_base):
@@ -207,13 +988,16 @@ class UV_OT_sort(UV_OT_base):
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and len(ctx.object.data.uv_layers) > 1
     def get_state(self, ctx, names, backup, idx):
         active = names[idx]
-        for o in get_meshes(ctx):
-            if o != ctx.object and len(o.data.uv_layers) > 1:
-                n = sorted([l.name for l in o.data.uv_layers], key=str.lower)
-                a = o.data.uv_layers.active.name
-                rebuild_uvs(o.data, n, get_uv_backup(o.data), n.index(a) if a in n else 0)
+        self.groups = {m: n for m, n in batch_groups(ctx).items() if len(m.uv_layers) > 1}
+        for m in other_meshes(ctx):
+            if len(m.uv_layers) > 1:
+                n = sorted([l.name for l in m.uv_layers], key=str.lower)
+                a = m.uv_layers.active.name
+                rebuild_uvs(m, n, get_uv_backup(m), n.index(a) if a in n else 0)
         names = sorted(names, key=str.lower)
         return names, backup, names.index(active)
+    def summary(self, ctx):
+        return {'INFO'}, f"Sorted UV maps on {count_text(self.groups)}"
 
 class UV_OT_reverse(UV_OT_base):
     bl_idname = "uv.reverse_maps"
@@ -223,47 +1007,85 @@ class UV_OT_reverse(UV_OT_base):
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and len(ctx.object.data.uv_layers) > 1
     def get_state(self, ctx, names, backup, idx):
         active = names[idx]
-        for o in get_meshes(ctx):
-            if o != ctx.object and len(o.data.uv_layers) > 1:
-                n = [l.name for l in o.data.uv_layers][::-1]
-                a = o.data.uv_layers.active.name
-                rebuild_uvs(o.data, n, get_uv_backup(o.data), n.index(a) if a in n else 0)
+        self.groups = {m: n for m, n in batch_groups(ctx).items() if len(m.uv_layers) > 1}
+        for m in other_meshes(ctx):
+            if len(m.uv_layers) > 1:
+                n = [l.name for l in m.uv_layers][::-1]
+                a = m.uv_layers.active.name
+                rebuild_uvs(m, n, get_uv_backup(m), n.index(a) if a in n else 0)
         names = names[::-1]
         return names, backup, names.index(active)
+    def summary(self, ctx):
+        return {'INFO'}, f"Reversed UV map order on {count_text(self.groups)}"
 
-class UV_OT_delete_empty(Operator):
+class UV_OT_delete_empty(UV_OT_chunked):
     bl_idname = "uv.delete_empty"
     bl_label = "Delete Empty UV Maps"
-    bl_description = "Delete UV maps with all coordinates at (0,0) from all selected objects"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_description = "Delete UV maps with all coordinates at (0,0), or collapsed to a single point, from all selected objects"
+    mode: bpy.props.EnumProperty(name="Mode", items=[('ORIGIN','At Origin','All UVs at (0,0)'),('DEGENERATE','Degenerate','All UVs collapsed to any single point')])
+    epsilon: bpy.props.FloatProperty(name="Tolerance", default=0.0, min=0.0, precision=6)
     @classmethod
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and ctx.object.data.uv_layers
-    def execute(self, ctx):
-        total_deleted = 0
-        for obj in get_meshes(ctx):
-            m = obj.data
-            to_delete = []
-            for layer in m.uv_layers:
-                # Check if all UVs are at origin (0,0)
-                coords = [0.0] * (len(m.loops) * 2)
-                if hasattr(layer.data, 'foreach_get'):
-                    layer.data.foreach_get('uv', coords)
-                    if all(c == 0.0 for c in coords):
-                        to_delete.append(layer.name)
-            # Delete empty maps
-            if to_delete:
-                backup = get_uv_backup(m)
-                names = [l.name for l in m.uv_layers]
-                for name in to_delete:
-                    if name in backup:
-                        del backup[name]
-                    if name in names:
-                        names.remove(name)
-                    total_deleted += 1
-                active_idx = m.uv_layers.active_index
-                rebuild_uvs(m, names, backup, min(active_idx, len(names)-1) if names else -1)
-        self.report({'INFO'}, f"Deleted {total_deleted} empty UV map(s)")
-        return {'FINISHED'}
+    def prepare(self, ctx):
+        self.groups, self.deleted = group_meshes(get_meshes(ctx)), 0
+        return list(self.groups)
+    def step(self, ctx, m):
+        to_delete = []
+        for layer in m.uv_layers:
+            if is_uv_empty(layer, len(m.loops), self.epsilon, self.mode == 'DEGENERATE'):
+                to_delete.append(layer.name)
+        # Delete empty maps
+        if to_delete:
+            backup = get_uv_backup(m)
+            names = [l.name for l in m.uv_layers]
+            for name in to_delete:
+                backup.pop(name, None)
+                if name in names:
+                    names.remove(name)
+                self.deleted += 1
+            active_idx = m.uv_layers.active_index
+            rebuild_uvs(m, names, backup, min(active_idx, len(names)-1) if names else -1)
+    def summary(self, ctx):
+        return {'INFO'}, f"Deleted {self.deleted} empty UV map(s) on {count_text(self.groups)}"
+
+class UV_OT_delete_duplicates(UV_OT_chunked):
+    bl_idname = "uv.delete_duplicates"
+    bl_label = "Delete Duplicate UV Maps"
+    bl_description = "Delete UV maps whose coordinates are identical to an earlier map on the same mesh, from all selected objects"
+    mode: bpy.props.EnumProperty(name="Mode", items=[('REMOVE','Remove','Delete duplicates, keeping the earliest slot'),('FIND','Find','Only report duplicates')])
+    across: bpy.props.BoolProperty(name="Across Selection", description="Also report maps identical to a map on another selected mesh (these are kept, each mesh needs its own)")
+    @classmethod
+    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and ctx.object.data.uv_layers
+    def prepare(self, ctx):
+        self.groups, self.found, self.shared = group_meshes(get_meshes(ctx)), [], 0
+        self.seen = {}
+        return list(self.groups)
+    def step(self, ctx, m):
+        backup = get_uv_backup(m)
+        first, dupes = {}, {}
+        for name, key in uv_digests(m, backup):
+            orig = first.setdefault(key, name)
+            if orig != name and np.array_equal(backup[name], backup[orig]):
+                dupes[name] = orig
+            elif self.across and self.seen.setdefault(key, m) != m:
+                self.shared += 1
+        self.found += [f"{m.name}: {d} = {o}" for d, o in dupes.items()]
+        if not dupes or self.mode == 'FIND': return
+        layers = m.uv_layers
+        # Hand the render and active choice to the kept original before rebuilding
+        render = next((l.name for l in layers if l.active_render), None)
+        if render in dupes: layers[dupes[render]].active_render = True
+        active = layers.active.name if layers.active else None
+        active = dupes.get(active, active)
+        names = [l.name for l in layers if l.name not in dupes]
+        for name in dupes: backup.pop(name, None)
+        rebuild_uvs(m, names, backup, names.index(active) if active in names else 0)
+    def summary(self, ctx):
+        verb = "Found" if self.mode == 'FIND' else "Deleted"
+        msg = f"{verb} {len(self.found)} duplicate UV map(s) on {count_text(self.groups)}"
+        if self.shared: msg += f", {self.shared} map(s) also identical on another selected mesh"
+        if self.found: msg += ": " + ", ".join(self.found[:5]) + (", ..." if len(self.found) > 5 else "")
+        return {'INFO'}, msg
 
 class UV_OT_delete_all(UV_OT_base):
     bl_idname = "uv.delete_all"
@@ -272,129 +1094,290 @@ class UV_OT_delete_all(UV_OT_base):
     @classmethod
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and ctx.object.data.uv_layers
     def get_state(self, ctx, names, backup, idx):
-        for o in get_meshes(ctx):
-            if o != ctx.object and o.data.uv_layers:
-                rebuild_uvs(o.data, [], {}, -1)
+        self.groups = {m: n for m, n in batch_groups(ctx).items() if m.uv_layers}
+        for m in other_meshes(ctx):
+            if m.uv_layers:
+                rebuild_uvs(m, [], {}, -1)
         return [], {}, -1
+    def summary(self, ctx):
+        return {'INFO'}, f"Deleted all UV maps on {count_text(self.groups)}"
     def invoke(self, ctx, event): return ctx.window_manager.invoke_confirm(self, event)
 
-class UV_OT_sync_order(Operator):
+class UV_OT_sync_order(UV_OT_chunked):
     bl_idname = "uv.sync_order"
     bl_label = "Sync UV Map Order"
     bl_description = "Match UV map order on all selected objects to the active object"
-    bl_options = {'REGISTER', 'UNDO'}
     @classmethod
-    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and len(get_meshes(ctx)) > 1
-    def execute(self, ctx):
-        order = [l.name for l in ctx.object.data.uv_layers]
-        for o in get_meshes(ctx):
-            if o == ctx.object: continue
-            m = o.data
-            cur = [l.name for l in m.uv_layers]
-            new = [n for n in order if n in cur] + [n for n in cur if n not in order]
-            a = m.uv_layers.active.name if m.uv_layers.active else None
-            rebuild_uvs(m, new, get_uv_backup(m), new.index(a) if a in new else 0)
-        return {'FINISHED'}
+    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and selection_summary(ctx)[0] > 1
+    def prepare(self, ctx):
+        self.order = [l.name for l in ctx.object.data.uv_layers]
+        groups = group_meshes(get_meshes(ctx))
+        # The reference mesh defines the order and is not rewritten, so it is not counted
+        self.groups = {m: n for m, n in groups.items() if m != ctx.object.data}
+        return list(self.groups)
+    def step(self, ctx, m):
+        cur = [l.name for l in m.uv_layers]
+        new = [n for n in self.order if n in cur] + [n for n in cur if n not in self.order]
+        a = m.uv_layers.active.name if m.uv_layers.active else None
+        rebuild_uvs(m, new, get_uv_backup(m), new.index(a) if a in new else 0)
+    def summary(self, ctx):
+        return {'INFO'}, f"Synced UV map order on {count_text(self.groups)}"
 
-class UV_OT_copy_unique(Operator):
+class UV_OT_copy_unique(UV_OT_chunked):
     bl_idname = "uv.sync_names"
     bl_label = "Sync UV Map Names"
     bl_description = "Create missing UV maps on all objects so all have the same map names"
-    bl_options = {'REGISTER', 'UNDO'}
     @classmethod
-    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and len(get_meshes(ctx)) > 1
-    def execute(self, ctx):
-        all_names = []
-        for o in get_meshes(ctx):
-            for l in o.data.uv_layers:
-                if l.name not in all_names: all_names.append(l.name)
-        added = 0
-        for o in get_meshes(ctx):
-            for name in all_names:
-                if name not in [l.name for l in o.data.uv_layers]:
-                    ensure_uv(o.data, name)
-                    added += 1
-        self.report({'INFO'}, f"Added {added} UV map(s)")
-        return {'FINISHED'}
+    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and selection_summary(ctx)[0] > 1
+    def prepare(self, ctx):
+        self.groups, self.added = group_meshes(get_meshes(ctx)), 0
+        self.all_names = list(dict.fromkeys(l.name for m in self.groups for l in m.uv_layers))
+        return list(self.groups)
+    def step(self, ctx, m):
+        self.added += ensure_uvs(m, self.all_names)
+    def summary(self, ctx):
+        return {'INFO'}, f"Added {self.added} UV map(s) on {count_text(self.groups)}"
 
-class UV_OT_transfer(Operator):
+class UV_OT_transfer(UV_OT_chunked):
     bl_idname = "uv.transfer"
     bl_label = "Replace All UV Maps?"
-    bl_description = "Transfer UV coordinate data from active object to others (requires matching topology)"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_description = "Transfer UV coordinate data from active object to others (matching topology, or projected from the nearest surface)"
     mode: bpy.props.EnumProperty(items=[('SEL','Selected',''),('ALL','All',''),('REP','Replace','')])
+    method: bpy.props.EnumProperty(name="Method", items=[
+        ('TOPOLOGY','Matching Topology','Copy UVs to objects with identical topology and skip the rest'),
+        ('NEAREST','Nearest Surface','Copy UVs to identical topology, project them from the nearest source surface onto the rest')])
     @classmethod
-    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and ctx.object.data.uv_layers and len(get_meshes(ctx)) > 1
-    def execute(self, ctx):
-        src = ctx.object.data
-        uv_names = [src.uv_layers.active.name] if self.mode == 'SEL' else [l.name for l in src.uv_layers]
-        ok = skip = 0
-        for o in get_meshes(ctx):
-            if o == ctx.object: continue
-            t = o.data
-            if len(src.loops) != len(t.loops): skip += 1; continue
+    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'OBJECT' and ctx.object.data.uv_layers and selection_summary(ctx)[0] > 1
+    def prepare(self, ctx):
+        self.src_obj = ctx.object
+        src = self.src_obj.data
+        self.uv_names = [src.uv_layers.active.name] if self.mode == 'SEL' else [l.name for l in src.uv_layers]
+        objs = get_meshes(ctx)
+        self.groups = group_meshes(objs)
+        self.groups.pop(src, None)
+        by_topology = group_topology(self.groups)
+        targets = by_topology.pop(topology_key(src), [])
+        self.others = [m for ms in by_topology.values() for m in ms]
+        self.snap = get_uv_backup(src)
+        self.proj, self.copied, self.projected = None, [], []
+        self.users = {}
+        for o in objs: self.users.setdefault(o.data, o)
+        items = [(t, False) for t in targets]
+        if self.method == 'NEAREST': items += [(t, True) for t in self.others]
+        return items
+    def step(self, ctx, item):
+        t, project = item
+        if not project:
             if self.mode == 'REP': rebuild_uvs(t, [], {}, -1)
-            for n in uv_names:
-                ensure_uv(t, n)
-                transfer_uv(src, t, n)
-            ok += 1
-        self.report({'INFO'} if ok else {'WARNING'}, f"Transferred to {ok}" + (f", skipped {skip}" if skip else ""))
-        return {'FINISHED'}
+            ensure_uvs(t, self.uv_names)
+            for n in self.uv_names:
+                transfer_uv(self.src_obj.data, t, n, self.snap)
+            tag_update(t)
+            self.copied.append(t)
+            return
+        if self.proj is None: self.proj = UVProjector(self.src_obj, self.snap)
+        hit = self.proj.weights(self.users[t])
+        if hit is None: return
+        if self.mode == 'REP': rebuild_uvs(t, [], {}, -1)
+        ensure_uvs(t, self.uv_names)
+        for n in self.uv_names:
+            t.uv_layers[n].data.foreach_set('uv', self.proj.sample(n, *hit))
+            touched(t, 1)
+        tag_update(t)
+        self.projected.append(t)
+    def summary(self, ctx):
+        ok = {m: self.groups[m] for m in self.copied + self.projected}
+        skip = {m: self.groups[m] for m in self.others if m not in ok}
+        msg = f"Transferred to {count_text(ok)}"
+        if self.projected: msg += f" ({len(self.projected)} projected)"
+        if skip: msg += f", skipped {count_text(skip)} with different topology"
+        return {'INFO'} if ok else {'WARNING'}, msg
     def invoke(self, ctx, event):
-        return ctx.window_manager.invoke_confirm(self, event) if self.mode == 'REP' else self.execute(ctx)
+        if self.mode != 'REP': return super().invoke(ctx, event)
+        # Confirming calls execute, which then goes modal on large selections
+        self.modal_run = use_modal(ctx)
+        return ctx.window_manager.invoke_confirm(self, event)
 
 class UV_OT_copy_uvs(Operator):
     bl_idname = "uv.copy_uvs"
     bl_label = "Copy UVs"
-    bl_description = "Copy selected UV coordinates in Edit Mode"
+    bl_description = "Copy selected UV coordinates of the active UV map in Edit Mode"
     bl_options = {'REGISTER', 'UNDO'}
     @classmethod
     def poll(cls, ctx): return ctx.object and ctx.object.mode == 'EDIT' and ctx.object.data.uv_layers.active
+    @profiled
     def execute(self, ctx):
-        global copied_uv_data
-        copied_uv_data.clear()
-        bm = bmesh.from_edit_mesh(ctx.object.data)
-        uv = bm.loops.layers.uv.active
-        if not uv: return {'CANCELLED'}
-        for f in bm.faces:
-            for l in f.loops:
-                if is_uv_selected(l, uv): copied_uv_data[l.index] = l[uv].uv.copy()
-        self.report({'INFO'}, f"Copied {len(copied_uv_data)} UVs")
+        idx = selected_corners(ctx.object)
+        if not len(idx):
+            self.report({'WARNING'}, "No UVs selected")
+            return {'CANCELLED'}
+        try:
+            copy_to_clipboard(ctx.object.data, [ctx.object.data.uv_layers.active.name], idx)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot write the UV clipboard: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Copied {len(idx)} UVs")
         return {'FINISHED'}
 
 class UV_OT_paste_uvs(Operator):
     bl_idname = "uv.paste_uvs"
     bl_label = "Paste UVs"
-    bl_description = "Paste copied UV coordinates in Edit Mode"
+    bl_description = "Paste the first copied UV map into the active UV map in Edit Mode"
     bl_options = {'REGISTER', 'UNDO'}
     @classmethod
-    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'EDIT' and ctx.object.data.uv_layers.active and copied_uv_data
+    def poll(cls, ctx): return ctx.object and ctx.object.mode == 'EDIT' and ctx.object.data.uv_layers.active and clipboard_header() is not None
+    @profiled
     def execute(self, ctx):
-        bm = bmesh.from_edit_mesh(ctx.object.data)
-        uv = bm.loops.layers.uv.active
-        if not uv: return {'CANCELLED'}
-        n = sum(1 for f in bm.faces for l in f.loops if l.index in copied_uv_data and not (l[uv].uv.__setitem__(slice(None), copied_uv_data[l.index]) or True) or l.index in copied_uv_data)
-        for f in bm.faces:
-            for l in f.loops:
-                if l.index in copied_uv_data: l[uv].uv = copied_uv_data[l.index]
-        bmesh.update_edit_mesh(ctx.object.data)
-        self.report({'INFO'}, f"Pasted {len([1 for f in bm.faces for l in f.loops if l.index in copied_uv_data])} UVs")
+        clip = load_clipboard()
+        obj = ctx.object
+        obj.update_from_editmode()
+        if clip is None or not clip[0]['names']:
+            self.report({'WARNING'}, "The UV clipboard is empty")
+            return {'CANCELLED'}
+        header, uvs, corners = clip
+        if header['topology'] != topology_key(obj.data):
+            self.report({'WARNING'}, f"Copied UVs are from '{header['source']}', which has a different topology")
+            return {'CANCELLED'}
+        idx = np.arange(header['loops'], dtype=np.int32) if corners is None else np.asarray(corners)
+        n = write_uv_selection(obj, idx, [(None, uvs[0].reshape(-1, 2))])
+        self.report({'INFO'}, f"Pasted {n} UVs")
+        return {'FINISHED'}
+
+class UV_OT_copy_maps(Operator):
+    bl_idname = "uv.copy_maps"
+    bl_label = "Copy UV Maps"
+    bl_description = "Copy UV maps of the active object to a clipboard file that any Blender session can paste from. In Edit Mode only the selected UVs are copied"
+    bl_options = {'REGISTER', 'UNDO'}
+    names: bpy.props.StringProperty(name="Names", description="Comma separated UV map names to copy, wildcards allowed. Empty copies all UV maps")
+    @classmethod
+    def poll(cls, ctx): return ctx.object and ctx.object.type == 'MESH' and ctx.object.mode in {'OBJECT', 'EDIT'} and ctx.object.data.uv_layers
+    @profiled
+    def execute(self, ctx):
+        obj = ctx.object
+        idx = selected_corners(obj) if obj.mode == 'EDIT' else None
+        names = match_names([l.name for l in obj.data.uv_layers], self.names)
+        if not names or (idx is not None and not len(idx)):
+            self.report({'WARNING'}, "No UVs selected" if names else f"No UV maps match '{self.names}'")
+            return {'CANCELLED'}
+        try:
+            copy_to_clipboard(obj.data, names, idx)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot write the UV clipboard: {e}")
+            return {'CANCELLED'}
+        what = f"{len(idx)} selected UVs" if idx is not None else f"{len(obj.data.loops)} UVs"
+        self.report({'INFO'}, f"Copied {len(names)} UV map(s), {what} each")
+        return {'FINISHED'}
+
+class UV_OT_paste_maps(Operator):
+    bl_idname = "uv.paste_maps"
+    bl_label = "Paste UV Maps"
+    bl_description = "Paste copied UV maps by name into the selected objects with the same topology as the copy, adding missing UV maps"
+    bl_options = {'REGISTER', 'UNDO'}
+    names: bpy.props.StringProperty(name="Names", description="Comma separated copied UV map names to paste, wildcards allowed. Empty pastes all of them")
+    @classmethod
+    def poll(cls, ctx): return ctx.object and ctx.object.type == 'MESH' and ctx.object.mode in {'OBJECT', 'EDIT'} and clipboard_header() is not None
+    @profiled
+    def execute(self, ctx):
+        clip = load_clipboard()
+        if clip is None:
+            self.report({'WARNING'}, "The UV clipboard is empty")
+            return {'CANCELLED'}
+        header, uvs, corners = clip
+        rows = [(i, n) for i, n in enumerate(header['names']) if n in match_names([n], self.names)]
+        if not rows:
+            self.report({'WARNING'}, f"No copied UV maps match '{self.names}'")
+            return {'CANCELLED'}
+        edit = ctx.object.mode == 'EDIT'
+        if edit: ctx.object.update_from_editmode()
+        meshes = [ctx.object.data] if edit else list(group_meshes(get_meshes(ctx)))
+        match = [m for m in meshes if topology_key(m) == header['topology']]
+        if edit and match:
+            idx = np.arange(header['loops'], dtype=np.int32) if corners is None else np.asarray(corners)
+            write_uv_selection(ctx.object, idx, [(n, uvs[i].reshape(-1, 2)) for i, n in rows])
+        else:
+            with uv_batch():
+                for m in match: paste_from_clipboard(m, uvs, corners, rows)
+        skipped = len(meshes) - len(match)
+        msg = f"Pasted {len(rows)} UV map(s) into {len(match)} mesh(es)"
+        self.report({'WARNING'} if skipped else {'INFO'},
+                    msg + (f", skipped {skipped} with a different topology than '{header['source']}'" if skipped else ""))
+        return {'FINISHED'} if match else {'CANCELLED'}
+
+class UV_OT_stats(Operator):
+    bl_idname = "uv.stats"
+    bl_label = "UV Map Statistics"
+    bl_description = "Recompute the statistics of the active object's UV maps now"
+    bl_options = {'REGISTER', 'INTERNAL'}
+    index: bpy.props.IntProperty(default=-1)
+    @classmethod
+    def poll(cls, ctx): return ctx.object and ctx.object.type == 'MESH'
+    @classmethod
+    def description(cls, ctx, props):
+        layers = ctx.object.data.uv_layers if ctx.object else ()
+        if not 0 <= props.index < len(layers): return cls.bl_description
+        hit = _uv_stats.get((ctx.object.data.session_uid, layers[props.index].name))
+        return stats_text(hit[1]) if hit and hit[1] else "Statistics not computed yet, click to compute them now"
+    @profiled
+    def execute(self, ctx):
+        mesh = ctx.object.data
+        _stats_fresh.pop(mesh.session_uid, None)
+        refresh_stats(mesh)
+        tag_redraw()
+        layers = mesh.uv_layers
+        if 0 <= self.index < len(layers):
+            hit = _uv_stats.get((mesh.session_uid, layers[self.index].name))
+            if hit and hit[1]: self.report({'INFO'}, f"{layers[self.index].name}: " + stats_text(hit[1]).replace("\n", ", "))
         return {'FINISHED'}
 
 # === MENUS ===
 
 class MESH_UL_uvmaps_plus(bpy.types.UIList):
-    """Custom UV Map list with warning colors for maps past slot 8"""
-    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+    """Custom UV Map list with warning colors for maps past slot 8, name filter, flag filter and display-only sorting"""
+    show_flag: bpy.props.EnumProperty(name="Show", items=[
+        ('ALL','All','Show all UV maps'),
+        ('EMPTY','Empty','Only maps with all UVs at (0,0)'),
+        ('RENDER','Render','Only the map used for rendering'),
+        ('LOCKED','Slot 9+','Only maps past slot 8, which the UV Editor cannot edit')])
+    show_stats: bpy.props.BoolProperty(name="Statistics", description="Show UV coverage of each map, with bounds and problems in its tooltip")
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index, flt_flag=0):
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            if index >= 8:
+            if flt_flag & FLAG_LOCKED:
                 layout.alert = True
             layout.prop(item, "name", text="", emboss=False, icon_value=icon)
-            icon = 'RESTRICT_RENDER_OFF' if item.active_render else 'RESTRICT_RENDER_ON'
+            if flt_flag & FLAG_EMPTY:
+                layout.label(text="", icon='GHOST_DISABLED')
+            if self.show_stats:
+                # Cache only; filter_items queues the computation
+                hit = _uv_stats.get((data.session_uid, item.name))
+                s = hit and hit[1]
+                icon = 'ERROR' if s and s['degenerate'] else 'FULLSCREEN_EXIT' if s and s['outside'] else 'NONE'
+                layout.operator(UV_OT_stats.bl_idname, text=f"{s['coverage']:.0%}" if s else "...", icon=icon, emboss=False).index = index
+            icon = 'RESTRICT_RENDER_OFF' if flt_flag & FLAG_RENDER else 'RESTRICT_RENDER_ON'
             layout.prop(item, "active_render", text="", icon=icon, emboss=False)
         elif self.layout_type == 'GRID':
             layout.alignment = 'CENTER'
             layout.label(text="", icon_value=icon)
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "show_flag", expand=True)
+        row.separator()
+        row.prop(self, "show_stats", text="", icon='INFO')
+        row.prop(self, "use_filter_sort_alpha", text="", icon='SORTALPHA')
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+    def filter_items(self, context, data, propname):
+        layers = getattr(data, propname)
+        flags = uv_flags(data)
+        if self.show_stats: queue_stats(data)
+        helper = bpy.types.UI_UL_list
+        shown = helper.filter_items_by_name(self.filter_name, self.bitflag_filter_item, layers, "name") if self.filter_name else []
+        shown = shown or [self.bitflag_filter_item] * len(flags)
+        want = SHOW_FLAGS.get(self.show_flag)
+        flt = [(v if not want or f & want else 0) | f for v, f in zip(shown, flags)]
+        order = helper.sort_items_by_name(layers, "name") if self.use_filter_sort_alpha else []
+        return flt, order
 
 class UV_MT_specials(Menu):
     bl_idname = "UV_MT_specials"
@@ -409,8 +1392,12 @@ class UV_MT_specials(Menu):
         l.separator()
         l.operator(UV_OT_duplicate.bl_idname, icon='DUPLICATE')
         l.operator(UV_OT_delete_empty.bl_idname, icon='TRASH')
+        l.operator(UV_OT_delete_duplicates.bl_idname, icon='TRASH')
         l.operator(UV_OT_delete_all.bl_idname, text="Delete All UV Maps", icon='TRASH')
-        if len(get_meshes(ctx)) > 1:
+        l.separator()
+        l.operator(UV_OT_copy_maps.bl_idname, icon='COPYDOWN')
+        l.operator(UV_OT_paste_maps.bl_idname, icon='PASTEDOWN')
+        if selection_summary(ctx)[0] > 1:
             l.separator()
             l.label(text="Batch", icon='OBJECT_DATA')
             l.operator(UV_OT_sync_order.bl_idname, icon='SORTSIZE')
@@ -419,6 +1406,8 @@ class UV_MT_specials(Menu):
             l.label(text="UV Data", icon='UV')
             l.operator(UV_OT_transfer.bl_idname, text="Transfer UV Data", icon='FORWARD').mode = 'SEL'
             l.operator(UV_OT_transfer.bl_idname, text="Transfer All UV Data", icon='FORWARD').mode = 'ALL'
+            op = l.operator(UV_OT_transfer.bl_idname, text="Project All UV Data", icon='MOD_DATA_TRANSFER')
+            op.mode, op.method = 'ALL', 'NEAREST'
             l.operator(UV_OT_transfer.bl_idname, text="Replace All UV Data", icon='FILE_REFRESH').mode = 'REP'
 
 # === PANEL ===
@@ -451,15 +1440,17 @@ class UVMAPSPLUS_PT_panel(Panel):
             col.operator(UV_OT_move.bl_idname, text="", icon='TRIA_UP').direction = 'UP'
             col.operator(UV_OT_move.bl_idname, text="", icon='TRIA_DOWN').direction = 'DOWN'
         
-        sel = get_meshes(ctx)
-        show_batch = len(sel) > 1 and ctx.object.mode == 'OBJECT'
+        objs, meshes, over_8 = selection_summary(ctx)
+        show_batch = objs > 1 and ctx.object.mode == 'OBJECT'
         show_slot_warning = uvs and uvs.active_index >= 8
         
         if show_batch or show_slot_warning:
             l.separator()
             box = l.box()
             if show_batch:
-                box.label(text=f"Batch: {len(sel)} objects", icon='OBJECT_DATA')
+                box.label(text=f"Batch: {objs} objects, {meshes} meshes", icon='OBJECT_DATA')
+                if over_8:
+                    box.label(text="Some selected objects have more than 8 UV maps", icon='INFO')
             if show_slot_warning:
                 box.alert = True
                 box.label(text="Slot 9+ cannot be edited in UV Editor. Move to slot 1-8 to edit.", icon='ERROR')
@@ -470,18 +1461,38 @@ class UVMAPSPLUS_PT_panel(Panel):
             row.operator(UV_OT_copy_uvs.bl_idname, text="Copy UVs", icon='COPYDOWN')
             row.operator(UV_OT_paste_uvs.bl_idname, text="Paste UVs", icon='PASTEDOWN')
 
+# === PREFERENCES ===
+
+class UVMAPSPLUS_preferences(AddonPreferences):
+    bl_idname = __package__
+    profile: bpy.props.BoolProperty(name="Profile Operators", description="Record time and work of every UV Maps+ operator")
+    profile_file: bpy.props.StringProperty(name="JSON Lines Log", description="Append each operator record to this file (optional)", subtype='FILE_PATH')
+    profile_capture: bpy.props.BoolProperty(name="cProfile Next Operator", description="Run the next UV Maps+ operator under cProfile and save the stats to the temp directory")
+    def draw(self, ctx):
+        l = self.layout
+        row = l.row()
+        row.prop(self, "profile")
+        row.prop(self, "profile_capture")
+        l.prop(self, "profile_file")
+        if not _profile_log: return
+        col = l.box().column(align=True)
+        for rec in reversed(_profile_log):
+            col.label(text=f"{rec['op']}: {rec['time'] * 1e3:.1f} ms, {rec['meshes']} mesh(es), {rec['layers']} layer(s), {rec['loops']} loops")
+            col.label(text="    " + ", ".join(f"{k} {rec[k] * 1e3:.1f} ms" for k in PROFILE_TIMERS))
+
 # === REGISTER ===
 
 classes = (
-    UV_OT_add, UV_OT_remove, UV_OT_duplicate, UV_OT_move, UV_OT_sort, UV_OT_reverse, UV_OT_delete_empty, UV_OT_delete_all,
-    UV_OT_sync_order, UV_OT_copy_unique, UV_OT_transfer, UV_OT_copy_uvs, UV_OT_paste_uvs,
-    MESH_UL_uvmaps_plus, UV_MT_specials, UVMAPSPLUS_PT_panel,
+    UV_OT_add, UV_OT_remove, UV_OT_duplicate, UV_OT_move, UV_OT_sort, UV_OT_reverse, UV_OT_delete_empty, UV_OT_delete_duplicates, UV_OT_delete_all,
+    UV_OT_sync_order, UV_OT_copy_unique, UV_OT_transfer, UV_OT_copy_uvs, UV_OT_paste_uvs, UV_OT_copy_maps, UV_OT_paste_maps, UV_OT_stats,
+    MESH_UL_uvmaps_plus, UV_MT_specials, UVMAPSPLUS_PT_panel, UVMAPSPLUS_preferences,
 )
 
 _default_panel = None
+_cli_command = None
 
 def register():
-    global _default_panel
+    global _default_panel, _cli_command
     for name in ('DATA_PT_uv_texture', 'DATA_PT_mesh_uv_maps'):
         if hasattr(bpy.types, name):
             try:
@@ -490,10 +1501,25 @@ def register():
                 break
             except: pass
     for cls in classes: bpy.utils.register_class(cls)
-    if sync_handler not in depsgraph_update_post: depsgraph_update_post.append(sync_handler)
+    for handlers in (load_post, undo_post, redo_post):
+        if reset_caches not in handlers: handlers.append(reset_caches)
+    for handler in (selection_changed, uv_data_changed):
+        if handler not in depsgraph_update_post: depsgraph_update_post.append(handler)
+    subscribe_sync()
+    _cli_command = bpy.utils.register_cli_command(batch.CLI_ID, batch.cli)
 
 def unregister():
-    if sync_handler in depsgraph_update_post: depsgraph_update_post.remove(sync_handler)
+    global _cli_command
+    if _cli_command:
+        bpy.utils.unregister_cli_command(_cli_command)
+        _cli_command = None
+    for handlers in (load_post, undo_post, redo_post):
+        if reset_caches in handlers: handlers.remove(reset_caches)
+    for handler in (selection_changed, uv_data_changed):
+        if handler in depsgraph_update_post: depsgraph_update_post.remove(handler)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if bpy.app.timers.is_registered(stats_timer): bpy.app.timers.unregister(stats_timer)
+    stop_stats()
     for cls in reversed(classes):
         try: bpy.utils.unregister_class(cls)
         except: pass
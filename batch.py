@@ -0,0 +1,234 @@
+"""Run UV Maps+ operators over many .blend files from the command line.
+
+    blender -b -c uv_maps_plus batch job.toml [--workers N] [--restart]
+
+The job spec (TOML or JSON) lists the files and the steps to run on each of them:
+
+    files = ["assets/**/*.blend"]   # globs, relative to the spec file
+    workers = 4                     # Blender processes at once (default: CPU count)
+    timeout = 300                   # seconds per file
+    save = true                     # save each file after its steps ran
+    active = "Body"                 # reference object for sync steps (default: first mesh by name)
+
+    [[steps]]
+    op = "delete_empty"
+    mode = "DEGENERATE"
+
+    [[steps]]
+    op = "rename"
+    names = { map1 = "UVMap", UVChannel_1 = "UVMap" }
+
+    [[steps]]
+    op = "sort_maps"
+
+Each file is opened by its own background Blender process. Finished files are appended to
+<spec>.progress.jsonl, so an interrupted run resumes where it stopped, and a summary is written
+to <spec>.report.json. Only the worker side needs bpy; the spec and scheduler run anywhere.
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+CLI_ID = "uv_maps_plus"
+RESULT_PREFIX = "UVMP_RESULT "
+# Step name -> bpy.ops.uv operator and the properties it accepts; rename is handled by the worker itself
+OPERATORS = {
+    'sort_maps': (),
+    'delete_empty': ('mode', 'epsilon'),
+    'delete_duplicates': ('mode',),
+    'sync_names': (),
+    'sync_order': (),
+}
+STATUSES = ('ok', 'failed', 'timeout')
+
+# === JOB SPEC ===
+
+def load_job(path):
+    """Parsed and validated job spec at path, with defaults filled in and files expanded; raises ValueError"""
+    path = Path(path)
+    try:
+        raw = path.read_text(encoding='utf-8')
+        spec = json.loads(raw) if path.suffix == '.json' else tomllib.loads(raw)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read job spec {path}: {e}") from e
+    return parse_job(spec, path.parent)
+
+def parse_job(spec, base):
+    unknown = set(spec) - {'files', 'workers', 'timeout', 'save', 'active', 'steps'}
+    if unknown: raise ValueError(f"unknown job key(s): {', '.join(sorted(unknown))}")
+    patterns = spec.get('files')
+    if isinstance(patterns, str): patterns = [patterns]
+    if not patterns or not all(isinstance(p, str) for p in patterns): raise ValueError("'files' must list one or more glob patterns")
+    steps = spec.get('steps')
+    if not steps: raise ValueError("'steps' must list one or more steps")
+    for i, step in enumerate(steps, 1):
+        op = step.get('op')
+        if op == 'rename':
+            names = step.get('names')
+            if not isinstance(names, dict) or not all(isinstance(v, str) for v in names.values()):
+                raise ValueError(f"step {i}: 'rename' needs a 'names' table of old = new")
+            extra = set(step) - {'op', 'names'}
+        elif op in OPERATORS:
+            extra = set(step) - {'op', *OPERATORS[op]}
+        else:
+            raise ValueError(f"step {i}: unknown op {op!r}, expected one of: {', '.join([*OPERATORS, 'rename'])}")
+        if extra: raise ValueError(f"step {i}: {op} does not take {', '.join(sorted(extra))}")
+    workers, timeout = spec.get('workers', os.cpu_count() or 1), spec.get('timeout', 600)
+    if not isinstance(workers, int) or workers < 1: raise ValueError("'workers' must be a positive integer")
+    if not isinstance(timeout, (int, float)) or timeout <= 0: raise ValueError("'timeout' must be a positive number of seconds")
+    files = {}
+    for p in patterns:
+        for f in sorted(glob.glob(str(Path(base) / p), recursive=True)):
+            files.setdefault(str(Path(f).resolve()), None)
+    return {
+        'files': list(files), 'workers': workers, 'timeout': timeout, 'save': bool(spec.get('save', True)),
+        'active': spec.get('active'), 'steps': steps,
+    }
+
+# === SCHEDULER ===
+
+def read_progress(path):
+    """File -> last record in a progress log; a missing log or a torn last line is fine"""
+    done = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try: rec = json.loads(line)
+                except ValueError: continue
+                done[rec['file']] = rec
+    except FileNotFoundError:
+        pass
+    return done
+
+def run_one(worker, path, job):
+    t = time.monotonic()
+    try:
+        rec = dict(worker(path, job, job['timeout']))
+    except subprocess.TimeoutExpired:
+        rec = {'status': 'timeout', 'error': f"timed out after {job['timeout']}s"}
+    except Exception as e:
+        rec = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+    rec.update(file=path, time=time.monotonic() - t)
+    return rec
+
+def run_batch(job, worker, progress, restart=False, log=print):
+    """Run worker(path, job, timeout) over the job's files on a thread pool, each call driving one process.
+    Files already 'ok' in the progress log are skipped unless restart. Returns a summary"""
+    progress = Path(progress)
+    if restart: progress.unlink(missing_ok=True)
+    done = read_progress(progress)
+    todo = [f for f in job['files'] if done.get(f, {}).get('status') != 'ok']
+    summary = {'total': len(job['files']), 'skipped': len(job['files']) - len(todo), **dict.fromkeys(STATUSES, 0), 'failures': {}}
+    with open(progress, 'a', encoding='utf-8') as out, ThreadPoolExecutor(job['workers']) as pool:
+        futures = [pool.submit(run_one, worker, f, job) for f in todo]
+        try:
+            for i, fut in enumerate(as_completed(futures), 1):
+                rec = fut.result()
+                out.write(json.dumps(rec) + "\n")
+                out.flush()
+                summary[rec['status']] += 1
+                if rec['status'] != 'ok': summary['failures'][rec['file']] = rec.get('error', rec['status'])
+                log(f"[{i}/{len(todo)}] {rec['status']:<7} {rec['file']} ({rec['time']:.1f}s)")
+        except KeyboardInterrupt:
+            # Files still running finish, queued ones are dropped; the progress log lets the next run resume
+            pool.shutdown(cancel_futures=True)
+            raise
+    return summary
+
+def blender_worker(binary):
+    """Worker that opens each file in its own background Blender process running this add-on's worker command"""
+    def work(path, job, timeout):
+        cmd = [binary, '--background', path, '--command', CLI_ID, 'worker', '--steps', json.dumps(job['steps'])]
+        if job['active']: cmd += ['--active', job['active']]
+        if job['save']: cmd.append('--save')
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        for line in proc.stdout.splitlines():
+            if line.startswith(RESULT_PREFIX):
+                return {'status': 'ok', 'steps': json.loads(line[len(RESULT_PREFIX):])}
+        err = [l for l in (proc.stderr + proc.stdout).splitlines() if l.strip()]
+        return {'status': 'failed', 'error': err[-1] if err else f"exit code {proc.returncode}"}
+    return work
+
+# === WORKER ===
+
+def rename_maps(meshes, names):
+    """Rename UV maps per names, skipping renames onto a name the mesh already has; return how many"""
+    renamed = 0
+    for mesh in {o.data: None for o in meshes}:
+        have = {l.name for l in mesh.uv_layers}
+        for l in list(mesh.uv_layers):
+            new = names.get(l.name)
+            if new and new not in have:
+                have.discard(l.name)
+                l.name = new
+                have.add(new)
+                renamed += 1
+    return renamed
+
+def run_steps(steps, active=None):
+    """Run steps on every mesh object of the open file, return a result per step"""
+    import bpy
+    ctx = bpy.context
+    meshes = sorted((o for o in ctx.view_layer.objects if o.type == 'MESH'), key=lambda o: o.name)
+    if not meshes: return []
+    ref = next((o for o in meshes if o.name == active), None) if active else meshes[0]
+    if ref is None: raise ValueError(f"active object {active!r} is not a mesh in this file")
+    if ctx.object and ctx.object.mode != 'OBJECT': bpy.ops.object.mode_set(mode='OBJECT')
+    results = []
+    with ctx.temp_override(selected_objects=meshes, object=ref, active_object=ref):
+        for step in steps:
+            op = step['op']
+            if op == 'rename':
+                results.append({'op': op, 'renamed': rename_maps(meshes, step['names'])})
+                continue
+            call = getattr(bpy.ops.uv, op)
+            # A step that does not apply to this file (one UV map to sort, one mesh to sync) is skipped, not a failure
+            if not call.poll():
+                results.append({'op': op, 'skipped': True})
+                continue
+            props = {k: v for k, v in step.items() if k != 'op'}
+            results.append({'op': op, 'result': sorted(call(**props))})
+    return results
+
+# === CLI ===
+
+def cli(argv):
+    """Entry point of `blender -c uv_maps_plus`, returns the exit code"""
+    ap = argparse.ArgumentParser(prog=f"blender -b -c {CLI_ID}", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest='mode', required=True)
+    b = sub.add_parser('batch', help="run a job spec over many .blend files")
+    b.add_argument('spec', help="job spec, .toml or .json")
+    b.add_argument('--workers', type=int, help="override the spec's worker count")
+    b.add_argument('--restart', action='store_true', help="ignore earlier progress and process every file again")
+    w = sub.add_parser('worker', help="run steps on the open file (used by batch)")
+    w.add_argument('--steps', required=True)
+    w.add_argument('--active')
+    w.add_argument('--save', action='store_true')
+    args = ap.parse_args(argv)
+    import bpy
+    if args.mode == 'worker':
+        results = run_steps(json.loads(args.steps), args.active)
+        if args.save and bpy.data.filepath: bpy.ops.wm.save_mainfile()
+        print(RESULT_PREFIX + json.dumps(results), flush=True)
+        return 0
+    try:
+        job = load_job(args.spec)
+        if args.workers is not None:
+            if args.workers < 1: raise ValueError("--workers must be positive")
+            job['workers'] = args.workers
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    spec = Path(args.spec)
+    summary = run_batch(job, blender_worker(bpy.app.binary_path), spec.with_suffix('.progress.jsonl'), args.restart)
+    spec.with_suffix('.report.json').write_text(json.dumps(summary, indent=1), encoding='utf-8')
+    print(f"{summary['ok']} ok, {summary['failed']} failed, {summary['timeout']} timed out, "
+          f"{summary['skipped']} already done, of {summary['total']} file(s)")
+    return 1 if summary['failed'] or summary['timeout'] else 0
@@ -0,0 +1,450 @@
+"""Lightweight stand-in for the parts of bpy, bmesh and mathutils that UV Maps+ touches.
+
+Meshes keep their vertex, loop, polygon and UV data in NumPy arrays so foreach_get/foreach_set
+behave like Blender's buffer fast path, and every UV layer write, mesh update and redraw tag is
+counted so benchmarks can report how much work an operator did, not only how long it took.
+"""
+import contextlib
+import fnmatch
+import importlib.util
+import itertools
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import numpy as np
+
+_uid = itertools.count(1)
+counters = {'uv_writes': 0, 'mesh_updates': 0, 'redraws': 0}
+
+def reset_counters():
+    for k in counters: counters[k] = 0
+
+# === RNA ===
+
+class _Prop:
+    def __init__(self, kind, **kw): self.kind, self.kw = kind, kw
+    @property
+    def default(self):
+        if 'default' in self.kw: return self.kw['default']
+        if self.kind == 'Enum': return self.kw['items'][0][0]
+        return {'Bool': False, 'Float': 0.0, 'Int': 0, 'String': ''}.get(self.kind)
+
+class _RNA:
+    """Base for Operator, Panel, ... : annotated properties start at their defaults, reports are collected"""
+    def __init__(self):
+        self.reports = []
+        for cls in reversed(type(self).__mro__):
+            for k, v in getattr(cls, '__annotations__', {}).items():
+                if isinstance(v, _Prop): setattr(self, k, v.default)
+    def report(self, kind, msg): self.reports.append((set(kind), msg))
+
+class _Data:
+    """bpy_prop_collection of a single array-backed property (uv, vector, value, ...)"""
+    def __init__(self, arr, *names, counted=False): self.arr, self.names, self.counted = arr, names, counted
+    def __len__(self): return len(self.arr)
+    def __getitem__(self, i): return types.SimpleNamespace(**{n: self.arr[i].copy() for n in self.names})
+    def foreach_get(self, attr, buf):
+        if attr not in self.names: raise AttributeError(attr)
+        buf[:] = self.arr.ravel()
+    def foreach_set(self, attr, buf):
+        if attr not in self.names: raise AttributeError(attr)
+        self.arr.ravel()[:] = np.asarray(buf, dtype=self.arr.dtype).ravel()
+        if self.counted: counters['uv_writes'] += 1
+
+class _Seq:
+    """Mesh element collection (vertices, loops, polygons, loop_triangles) with array fields"""
+    def __init__(self, n, **fields): self.n, self.fields = n, fields
+    def __len__(self): return self.n
+    def foreach_get(self, attr, buf): buf[:] = self.fields[attr].ravel()
+
+class UIList(_RNA):
+    bitflag_filter_item = 1 << 30
+    layout_type = 'DEFAULT'
+    def __init__(self):
+        super().__init__()
+        self.filter_name, self.use_filter_invert = "", False
+        self.use_filter_sort_alpha = self.use_filter_sort_reverse = False
+
+class UI_UL_list:
+    """Name filter and sort helpers, as in Blender's scripts/startup/bl_ui/__init__.py"""
+    @staticmethod
+    def filter_items_by_name(pattern, bitflag, items, propname="name", flags=None, reverse=False):
+        if not pattern or not items: return []
+        pattern = "*" + pattern.lower() + "*"
+        flags = flags or [0] * len(items)
+        for i, item in enumerate(items):
+            if fnmatch.fnmatch(getattr(item, propname).lower(), pattern) != reverse: flags[i] |= bitflag
+        return flags
+    @staticmethod
+    def sort_items_by_name(items, propname="name"):
+        order = sorted(range(len(items)), key=lambda i: getattr(items[i], propname).lower())
+        new = [0] * len(items)
+        for pos, i in enumerate(order): new[i] = pos
+        return new
+
+# === MESH ===
+
+class MeshUVLoopLayer:
+    def __init__(self, owner, name, n):
+        self._owner, self._name = owner, name
+        self.data = _Data(np.zeros((n, 2), np.float32), 'uv', 'vector', counted=True)
+        self.vertex_selection = _Data(np.zeros(n, bool), 'value')
+    @property
+    def name(self): return self._name
+    @name.setter
+    def name(self, v):
+        if v != self._name: self._name = self._owner._unique(v)
+    @property
+    def active_render(self): return self._owner._render is self
+    @active_render.setter
+    def active_render(self, v):
+        if v: self._owner._render = self
+    @property
+    def active(self): return self._owner._active is self
+    def as_pointer(self): return id(self)
+
+class UVLoopLayers:
+    def __init__(self, mesh): self._mesh, self._items, self._active, self._render = mesh, [], None, None
+    def _unique(self, name):
+        used = {l._name for l in self._items}
+        if name not in used: return name
+        i = 1
+        while f"{name}.{i:03d}" in used: i += 1
+        return f"{name}.{i:03d}"
+    def _new(self, name):
+        l = MeshUVLoopLayer(self, self._unique(name), len(self._mesh.loops))
+        self._items.append(l)
+        if self._active is None: self._active = l
+        if self._render is None: self._render = l
+        return l
+    def __iter__(self): return iter(list(self._items))
+    def __len__(self): return len(self._items)
+    def __bool__(self): return bool(self._items)
+    def __contains__(self, name): return self.get(name) is not None
+    def __getitem__(self, k):
+        if not isinstance(k, str): return self._items[k]
+        l = self.get(k)
+        if l is None: raise KeyError(k)
+        return l
+    def get(self, name, default=None): return next((l for l in self._items if l._name == name), default)
+    def new(self, name="UVMap", do_init=True): return self._new(name)
+    def remove(self, layer):
+        i = self._items.index(layer)
+        self._items.pop(i)
+        if not self._items: self._active = self._render = None; return
+        if self._active is layer: self._active = self._items[min(i, len(self._items) - 1)]
+        if self._render is layer: self._render = self._items[0]
+    @property
+    def active(self): return self._active
+    @active.setter
+    def active(self, l): self._active = l
+    @property
+    def active_index(self): return self._items.index(self._active) if self._active in self._items else -1
+    @active_index.setter
+    def active_index(self, i):
+        if 0 <= i < len(self._items): self._active = self._items[i]
+
+class _Attribute:
+    def __init__(self, name, data): self.name, self.data = name, data
+
+class Attributes:
+    def __init__(self, mesh): self._mesh = mesh
+    def new(self, name, type, domain):
+        if (type, domain) != ('FLOAT2', 'CORNER'): raise NotImplementedError((type, domain))
+        l = self._mesh.uv_layers._new(name)
+        return _Attribute(l.name, l.data)
+
+class ID:
+    def __init__(self, name): self.name, self.session_uid = name, next(_uid)
+    def as_pointer(self): return id(self)
+    @property
+    def original(self): return self
+
+class Mesh(ID):
+    def __init__(self, name, verts, loop_verts, loop_start, loop_total):
+        super().__init__(name)
+        self.vertices = _Seq(len(verts), co=np.asarray(verts, np.float32))
+        self.loops = _Seq(len(loop_verts), vertex_index=np.asarray(loop_verts, np.int32))
+        self.polygons = _Seq(len(loop_start), loop_start=np.asarray(loop_start, np.int32), loop_total=np.asarray(loop_total, np.int32))
+        self.loop_triangles = _Seq(0)
+        self.uv_layers = UVLoopLayers(self)
+        self.attributes = Attributes(self)
+        self.is_editmode = False
+    def update(self): counters['mesh_updates'] += 1
+    def calc_loop_triangles(self):
+        start, total = self.polygons.fields['loop_start'], self.polygons.fields['loop_total']
+        fans = np.arange(total.max() - 2 if len(total) else 0)
+        face, fan = np.nonzero(fans[None, :] < (total - 2)[:, None])
+        s = start[face]
+        tl = np.stack([s, s + fan + 1, s + fan + 2], 1).astype(np.int32)
+        self.loop_triangles = _Seq(len(tl), loops=tl, vertices=self.loops.fields['vertex_index'][tl], polygon_index=face.astype(np.int32))
+
+def grid_mesh(name, n_loops, size=1.0):
+    """Quad grid with about n_loops corners spanning size x size on the XY plane"""
+    faces = max(1, n_loops // 4)
+    w = max(1, int(faces ** 0.5)); h = -(-faces // w)
+    xs, ys = np.meshgrid(np.linspace(0, size, w + 1), np.linspace(0, size, h + 1))
+    verts = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], 1)
+    q = np.arange(faces); v0 = (q // w) * (w + 1) + q % w
+    loops = np.stack([v0, v0 + 1, v0 + w + 2, v0 + w + 1], 1).ravel()
+    return Mesh(name, verts, loops, np.arange(faces) * 4, np.full(faces, 4))
+
+def scene(loops, layers, objects, seed=0):
+    """Select objects mesh objects, each with its own grid of about loops corners and layers random UV maps"""
+    rng = np.random.default_rng(seed)
+    objs = []
+    for i in range(objects):
+        mesh = grid_mesh(f"Mesh{i}", loops)
+        for j in range(layers):
+            mesh.uv_layers._new(f"UVMap{j:02d}").data.arr[:] = rng.random((len(mesh.loops), 2), dtype=np.float32)
+        objs.append(Object(f"Object{i}", mesh))
+    bpy.context.object, bpy.context.selected_objects = objs[0], objs
+    bpy.context.view_layer.objects = objs
+    return objs
+
+class Object(ID):
+    def __init__(self, name, data):
+        super().__init__(name)
+        self.data, self.type, self.mode = data, 'MESH', 'OBJECT'
+        self.matrix_world = Matrix(np.eye(4))
+    def update_from_editmode(self): return True
+
+def depsgraph(*ids, geometry=True):
+    """Depsgraph as passed to depsgraph_update_post, reporting updates of ids (meshes or objects)"""
+    updates = [types.SimpleNamespace(id=i, is_updated_geometry=geometry) for i in ids]
+    meshes = any(isinstance(getattr(i, 'data', i), Mesh) for i in ids)
+    return types.SimpleNamespace(updates=updates, id_type_updated=lambda kind: kind == 'MESH' and meshes)
+
+# === BMESH ===
+
+class BMLoopUV:
+    def __init__(self, layer, i): self._layer, self._i = layer, i
+    @property
+    def uv(self): return self._layer.data.arr[self._i].copy()
+    @uv.setter
+    def uv(self, v): self._layer.data.arr[self._i] = v
+    @property
+    def select(self): return bool(self._layer.vertex_selection.arr[self._i])
+
+class BMLoop:
+    def __init__(self, i): self.index = i
+    def __getitem__(self, layer): return BMLoopUV(layer, self.index)
+
+class BMFace:
+    def __init__(self, start, total): self.loops = [BMLoop(i) for i in range(start, start + total)]
+
+class BMFaces(list):
+    def ensure_lookup_table(self): pass
+
+class BMesh:
+    """Edit-mesh view whose loops read and write the mesh's UV arrays directly"""
+    def __init__(self, mesh):
+        f = mesh.polygons.fields
+        self.faces = BMFaces(BMFace(s, t) for s, t in zip(f['loop_start'].tolist(), f['loop_total'].tolist()))
+        self.loops = types.SimpleNamespace(layers=types.SimpleNamespace(uv=BMLayers(mesh.uv_layers)))
+
+class BMLayers:
+    """bm.loops.layers.uv; the mesh's own UV layers stand in for BMesh layers"""
+    def __init__(self, layers): self._layers = layers
+    @property
+    def active(self): return self._layers.active
+    def get(self, name, default=None): return self._layers.get(name, default)
+    def new(self, name): return self._layers._new(name)
+
+# === MATHUTILS ===
+
+class Matrix:
+    def __init__(self, a): self.a = np.array(a, dtype=np.float64)
+    def inverted(self): return Matrix(np.linalg.inv(self.a))
+    def __matmul__(self, o): return Matrix(self.a @ o.a)
+    def __array__(self, dtype=None, copy=None): return self.a if dtype is None else self.a.astype(dtype)
+
+def closest_on_triangles(p, a, b, c):
+    """Closest point to p on each triangle (a, b, c), vectorized (Ericson, Real-Time Collision Detection 5.1.5)"""
+    ab, ac, ap, bp, cp = b - a, c - a, p - a, p - b, p - c
+    d1, d2 = (ab * ap).sum(1), (ac * ap).sum(1)
+    d3, d4 = (ab * bp).sum(1), (ac * bp).sum(1)
+    d5, d6 = (ab * cp).sum(1), (ac * cp).sum(1)
+    va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+    den = va + vb + vc
+    den[den == 0] = 1
+    res = a + ab * (vb / den)[:, None] + ac * (vc / den)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for mask, val in (
+            ((vc <= 0) & (d1 >= 0) & (d3 <= 0), lambda: a + ab * (d1 / (d1 - d3))[:, None]),
+            ((vb <= 0) & (d2 >= 0) & (d6 <= 0), lambda: a + ac * (d2 / (d2 - d6))[:, None]),
+            ((va <= 0) & (d4 >= d3) & (d5 >= d6), lambda: b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, None]),
+            ((d1 <= 0) & (d2 <= 0), lambda: a),
+            ((d3 >= 0) & (d4 <= d3), lambda: b),
+            ((d6 >= 0) & (d5 <= d6), lambda: c),
+        ):
+            if mask.any(): res[mask] = val()[mask]
+    return res
+
+class BVHTree:
+    """find_nearest over triangles bucketed by centroid into a uniform grid, searched in growing rings of cells"""
+    @classmethod
+    def FromPolygons(cls, vertices, polygons, all_triangles=False, epsilon=0.0):
+        self = cls()
+        v, t = np.asarray(vertices, np.float64), np.asarray(polygons, np.int64)
+        self.a, self.b, self.c = v[t[:, 0]], v[t[:, 1]], v[t[:, 2]]
+        cen = (self.a + self.b + self.c) / 3
+        self.lo, ext = cen.min(0), np.ptp(cen, axis=0)
+        flat = ext <= ext.max() * 1e-6
+        # Square cells holding about four triangles each, over the axes the mesh actually spans
+        self.h = (np.prod(ext[~flat]) / max(1, len(t) / 4)) ** (1 / max(1, (~flat).sum())) if ext.max() > 0 else 1.0
+        self.res = np.where(flat, 1, np.ceil(ext / self.h)).astype(np.int64)
+        keys = self._key(self._cells(cen))
+        self.order = np.argsort(keys, kind='stable')
+        self.start = np.searchsorted(keys[self.order], np.arange(np.prod(self.res) + 1))
+        self.reach = max(np.linalg.norm(p - cen, axis=1).max() for p in (self.a, self.b, self.c))
+        return self
+    def _cells(self, p): return np.clip(((p - self.lo) / self.h).astype(np.int64), 0, self.res - 1)
+    def _key(self, c): return (c[..., 0] * self.res[1] + c[..., 1]) * self.res[2] + c[..., 2]
+    def find_nearest(self, co, distance=1.84467e19):
+        p = np.asarray(co, np.float64)
+        c, r = self._cells(p), self.res
+        best = None
+        for ring in range(int(r.max()) + 1):
+            lo, hi = np.maximum(c - ring, 0), np.minimum(c + ring, r - 1)
+            keys = self._key(np.stack(np.meshgrid(*[np.arange(lo[k], hi[k] + 1) for k in range(3)], indexing='ij'), -1))
+            s, n = self.start[keys].ravel(), (self.start[keys + 1] - self.start[keys]).ravel()
+            if n.sum():
+                idx = self.order[np.repeat(s - np.concatenate([[0], np.cumsum(n)[:-1]]), n) + np.arange(n.sum())]
+                q = closest_on_triangles(p, self.a[idx], self.b[idx], self.c[idx])
+                d = ((q - p) ** 2).sum(1)
+                best = (idx, q, d, int(d.argmin()))
+            # Triangles outside the searched block are at least the gap to its border minus their reach away
+            gap = min([p[k] - (self.lo[k] + lo[k] * self.h) for k in range(3) if lo[k] > 0] +
+                      [self.lo[k] + (hi[k] + 1) * self.h - p[k] for k in range(3) if hi[k] < r[k] - 1] + [np.inf])
+            if best and np.sqrt(best[2][best[3]]) <= gap - self.reach: break
+        idx, q, d, j = best
+        i = int(idx[j])
+        n = np.cross(self.b[i] - self.a[i], self.c[i] - self.a[i])
+        return tuple(q[j]), tuple(n / (np.linalg.norm(n) or 1.0)), i, float(np.sqrt(d[j]))
+
+# === CONTEXT ===
+
+class Area:
+    type = 'PROPERTIES'
+    def tag_redraw(self): counters['redraws'] += 1
+
+class WindowManager:
+    def invoke_confirm(self, op, event): return op.execute(bpy.context)
+    def progress_begin(self, lo, hi): pass
+    def progress_update(self, v): pass
+    def progress_end(self): pass
+    def event_timer_add(self, step, window=None): return object()
+    def event_timer_remove(self, timer): pass
+    def modal_handler_add(self, op): self.modal = op
+    @property
+    def windows(self): return [types.SimpleNamespace(screen=bpy.context.screen)]
+
+class ViewLayer:
+    def __init__(self): self.objects = []
+    def as_pointer(self): return id(self)
+
+class Context:
+    def __init__(self):
+        self.object = None
+        self.selected_objects = []
+        self.view_layer = ViewLayer()
+        self.screen = types.SimpleNamespace(areas=[Area() for _ in range(6)])
+        self.window_manager = WindowManager()
+        self.window = None
+        self.workspace = types.SimpleNamespace(status_text_set=lambda text: None)
+        self.preferences = types.SimpleNamespace(addons={})
+    @contextlib.contextmanager
+    def temp_override(self, **kw):
+        old = {k: getattr(self, k, None) for k in kw}
+        for k, v in kw.items(): setattr(self, k, v)
+        try:
+            yield
+        finally:
+            for k, v in old.items(): setattr(self, k, v)
+
+# === OPERATORS ===
+
+class OpCaller:
+    """bpy.ops.<module>.<name> of a registered operator; calling it with a failing poll raises, as in Blender"""
+    def __init__(self, cls): self.cls = cls
+    def poll(self): return bool(self.cls.poll(bpy.context)) if hasattr(self.cls, 'poll') else True
+    def __call__(self, **props):
+        if not self.poll(): raise RuntimeError(f"Operator bpy.ops.{self.cls.bl_idname}.poll() failed, context is incorrect")
+        op = self.cls()
+        for k, v in props.items(): setattr(op, k, v)
+        return op.execute(bpy.context)
+
+def register_class(cls):
+    if issubclass(cls, bpy.types.Operator):
+        mod, name = cls.bl_idname.split('.')
+        setattr(getattr(bpy.ops, mod), name, OpCaller(cls))
+
+def unregister_class(cls):
+    if issubclass(cls, bpy.types.Operator):
+        mod, name = cls.bl_idname.split('.')
+        getattr(bpy.ops, mod).__dict__.pop(name, None)
+
+bpy = None
+
+user_dir = None
+
+def extension_path_user(package, *, path="", create=False):
+    """Per-extension user directory under user_dir (a fresh temporary directory unless set)"""
+    global user_dir
+    if user_dir is None: user_dir = tempfile.mkdtemp(prefix="uvmp-user-")
+    p = os.path.join(user_dir, package, path)
+    if create: os.makedirs(p, exist_ok=True)
+    return p
+
+def install():
+    """Register fake bpy, bmesh and mathutils modules in sys.modules and return bpy"""
+    global bpy
+    bpy = types.ModuleType('bpy')
+    bpy.context = Context()
+    t = bpy.types = types.ModuleType('bpy.types')
+    for n in ('Operator', 'Menu', 'Panel', 'AddonPreferences'):
+        setattr(t, n, type(n, (_RNA,), {}))
+    t.UIList, t.UI_UL_list = UIList, UI_UL_list
+    t.MeshUVLoopLayer, t.UVLoopLayers, t.Mesh, t.Object = MeshUVLoopLayer, UVLoopLayers, Mesh, Object
+    t.LayerObjects = type('LayerObjects', (), {})
+    props = bpy.props = types.ModuleType('bpy.props')
+    for k in ('Bool', 'Float', 'Int', 'String', 'Enum'):
+        setattr(props, k + 'Property', (lambda k: lambda **kw: _Prop(k, **kw))(k))
+    app = bpy.app = types.ModuleType('bpy.app')
+    app.background, app.version = True, (4, 2, 0)
+    h = app.handlers = types.ModuleType('bpy.app.handlers')
+    for n in ('depsgraph_update_post', 'load_post', 'undo_post', 'redo_post'):
+        setattr(h, n, [])
+    h.persistent = lambda f: f
+    timers = []
+    app.timers = types.SimpleNamespace(registered=timers, register=lambda fn, first_interval=0: timers.append(fn),
+                                       is_registered=lambda fn: fn in timers, unregister=timers.remove)
+    bpy.path = types.SimpleNamespace(abspath=lambda p: p)
+    bpy.utils = types.SimpleNamespace(register_class=register_class, unregister_class=unregister_class,
+                                      register_cli_command=lambda id, fn: (id, fn), unregister_cli_command=lambda handle: None,
+                                      extension_path_user=extension_path_user)
+    bpy.ops = types.SimpleNamespace(uv=types.SimpleNamespace(), object=types.SimpleNamespace(mode_set=lambda mode: {'FINISHED'}))
+    subs = []
+    bpy.msgbus = types.SimpleNamespace(subscriptions=subs, subscribe_rna=lambda **kw: subs.append(kw), clear_by_owner=lambda o: subs.clear())
+    mu = types.ModuleType('mathutils')
+    mu.Matrix = Matrix
+    mu.bvhtree = types.ModuleType('mathutils.bvhtree')
+    mu.bvhtree.BVHTree = BVHTree
+    bm = types.ModuleType('bmesh')
+    bm.from_edit_mesh = BMesh
+    bm.update_edit_mesh = lambda mesh, **kw: None
+    sys.modules.update({'bpy': bpy, 'bpy.types': t, 'bpy.props': props, 'bpy.app': app, 'bpy.app.handlers': h,
+                        'bmesh': bm, 'mathutils': mu, 'mathutils.bvhtree': mu.bvhtree})
+    return bpy
+
+def load_addon(path=Path(__file__).resolve().parent.parent / "__init__.py", name="uv_maps_plus"):
+    """Import the add-on package at path against the fake modules (install() must run first)"""
+    spec = importlib.util.spec_from_file_location(name, path, submodule_search_locations=[str(Path(path).parent)])
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
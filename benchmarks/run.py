@@ -0,0 +1,230 @@
+"""Headless UV Maps+ benchmarks on plain CPython, driven through the bpy stand-in in fake_bpy.py.
+
+Each case builds a fresh scene, runs one operator or core function and records the best wall
+time of several runs, the peak traced memory of one extra run, and the work the fake counted
+(UV layer writes, mesh updates, redraw tags). Results can be saved as a baseline and diffed.
+
+    python benchmarks/run.py                          quick sweep
+    python benchmarks/run.py --full                   10k-5M loops, 1-32 layers, 1-2000 objects
+    python benchmarks/run.py --only move,sort         subset of benchmarks
+    python benchmarks/run.py --save baseline.json     record results
+    python benchmarks/run.py --compare baseline.json  report changes against a baseline
+
+Absolute times of 'project' and 'paste' are dominated by the stand-in BVH and BMesh, which are pure
+Python per corner; compare them against a baseline only.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import fake_bpy
+
+bpy = fake_bpy.install()
+addon = fake_bpy.load_addon()
+ctx = bpy.context
+
+QUICK = {'loops': [10_000, 100_000, 1_000_000], 'layers': [1, 8, 32], 'objects': [1, 100, 500]}
+FULL = {'loops': [10_000, 100_000, 1_000_000, 5_000_000], 'layers': [1, 4, 8, 16, 32], 'objects': [1, 10, 100, 500, 2000]}
+DEFAULTS = {'loops': 100_000, 'layers': 8, 'objects': 1}
+OBJECT_LOOPS = 1_000
+# Per-benchmark upper bounds; the stand-in BVH and BMesh are pure Python per corner, so project and paste are capped
+CAPS = {
+    'quick': {'project': {'loops': 5_000, 'objects': 10}, 'paste': {'loops': 100_000}},
+    'full': {'project': {'loops': 20_000}},
+}
+MULTI = {'sync', 'sync_order', 'transfer', 'project'}
+
+def operator(cls, **props):
+    op = cls()
+    for k, v in props.items(): setattr(op, k, v)
+    return lambda: op.execute(ctx)
+
+# === BENCHMARKS ===
+# Each takes the built objects, prepares the scene and returns the callable to time.
+
+def bench_backup(objs):
+    mesh = objs[0].data
+    return lambda: [addon.get_uv_backup(mesh)[l.name] for l in mesh.uv_layers]
+
+def bench_add(objs):
+    return operator(addon.UV_OT_add)
+
+def bench_remove(objs):
+    for o in objs: o.data.uv_layers.active_index = 0
+    return operator(addon.UV_OT_remove)
+
+def bench_duplicate(objs):
+    for o in objs: o.data.uv_layers.active_index = 0
+    return operator(addon.UV_OT_duplicate)
+
+def bench_move(objs):
+    for o in objs: o.data.uv_layers.active_index = len(o.data.uv_layers) - 1
+    return operator(addon.UV_OT_move, direction='UP')
+
+def bench_sort(objs):
+    for o in objs:
+        for l in list(o.data.uv_layers): l.name = "z" + l.name
+        for l in list(o.data.uv_layers)[::-1]: l.name = l.name[1:]
+    for o in objs: o.data.uv_layers._items.reverse()
+    return operator(addon.UV_OT_sort)
+
+def bench_reverse(objs):
+    return operator(addon.UV_OT_reverse)
+
+def bench_delete_duplicates(objs):
+    for o in objs:
+        layers = o.data.uv_layers
+        for i in range(1, len(layers), 2): layers[i].data.arr[:] = layers[i - 1].data.arr
+    return operator(addon.UV_OT_delete_duplicates)
+
+def bench_delete_all(objs):
+    return operator(addon.UV_OT_delete_all)
+
+def bench_delete_empty(objs):
+    for o in objs: o.data.uv_layers[0].data.arr[:] = 0
+    return operator(addon.UV_OT_delete_empty)
+
+def bench_sync_order(objs):
+    for o in objs[1:]: o.data.uv_layers._items.reverse()
+    return operator(addon.UV_OT_sync_order)
+
+def bench_sync_names(objs):
+    for i, o in enumerate(objs[1:]):
+        layers = o.data.uv_layers
+        if len(layers) > 1: layers.remove(layers[i % len(layers)])
+    return operator(addon.UV_OT_copy_unique)
+
+def bench_sync(objs):
+    addon.remember_state(ctx.object)
+    def run():
+        layer = ctx.object.data.uv_layers[0]
+        layer.name = "Renamed" if layer.name != "Renamed" else "UVMap00"
+        addon.on_uv_renamed()
+    return run
+
+def bench_transfer(objs):
+    return operator(addon.UV_OT_transfer, mode='ALL')
+
+def bench_project(objs):
+    for i, o in enumerate(objs[1:], 1):
+        o.data = fake_bpy.grid_mesh(f"LOD{i}", max(4, len(o.data.loops) // 4))
+    return operator(addon.UV_OT_transfer, mode='ALL', method='NEAREST')
+
+def bench_copy(objs):
+    obj = objs[0]
+    obj.mode = 'EDIT'
+    obj.data.uv_layers.active.vertex_selection.arr[::2] = True
+    return operator(addon.UV_OT_copy_uvs)
+
+def bench_paste(objs):
+    bench_copy(objs)()
+    return operator(addon.UV_OT_paste_uvs)
+
+def bench_copy_maps(objs):
+    return operator(addon.UV_OT_copy_maps)
+
+def bench_paste_maps(objs):
+    ctx.selected_objects = objs[:1]
+    bench_copy_maps(objs)()
+    ctx.selected_objects = objs
+    for o in objs: o.data.uv_layers.remove(o.data.uv_layers[0])
+    addon.selection_changed()
+    return operator(addon.UV_OT_paste_maps)
+
+def bench_stats(objs):
+    return lambda: [addon.refresh_stats(o.data) for o in objs]
+
+BENCHMARKS = {
+    'backup': (bench_backup, ('loops', 'layers')),
+    'add': (bench_add, ('loops', 'layers', 'objects')),
+    'remove': (bench_remove, ('loops', 'layers', 'objects')),
+    'duplicate': (bench_duplicate, ('loops', 'layers', 'objects')),
+    'move': (bench_move, ('loops', 'layers', 'objects')),
+    'sort': (bench_sort, ('loops', 'layers', 'objects')),
+    'reverse': (bench_reverse, ('loops', 'layers', 'objects')),
+    'delete_empty': (bench_delete_empty, ('loops', 'layers', 'objects')),
+    'delete_duplicates': (bench_delete_duplicates, ('loops', 'layers', 'objects')),
+    'delete_all': (bench_delete_all, ('loops', 'layers', 'objects')),
+    'sync_order': (bench_sync_order, ('loops', 'layers', 'objects')),
+    'sync_names': (bench_sync_names, ('loops', 'layers', 'objects')),
+    'sync': (bench_sync, ('layers', 'objects')),
+    'transfer': (bench_transfer, ('loops', 'layers', 'objects')),
+    'project': (bench_project, ('loops', 'layers', 'objects')),
+    'copy': (bench_copy, ('loops',)),
+    'paste': (bench_paste, ('loops',)),
+    'copy_maps': (bench_copy_maps, ('loops', 'layers')),
+    'paste_maps': (bench_paste_maps, ('loops', 'layers', 'objects')),
+    'stats': (bench_stats, ('loops', 'layers')),
+}
+
+def cases(sweep, caps, only):
+    """(name, params) for every benchmark along each axis it scales with, others held at DEFAULTS"""
+    for name, (_, axes) in BENCHMARKS.items():
+        if only and name not in only: continue
+        seen = set()
+        for axis in axes:
+            for value in sweep[axis]:
+                params = dict(DEFAULTS, **{axis: value})
+                if name in MULTI: params['objects'] = max(params['objects'], 2)
+                if axis == 'objects': params['loops'] = OBJECT_LOOPS
+                for k, cap in caps.get(name, {}).items(): params[k] = min(params[k], cap)
+                key = tuple(sorted(params.items()))
+                if key not in seen:
+                    seen.add(key)
+                    yield name, params
+
+def measure(name, params, repeat):
+    bench = BENCHMARKS[name][0]
+    best, counts = float('inf'), None
+    for _ in range(repeat):
+        run = bench(fake_bpy.scene(**params))
+        fake_bpy.reset_counters()
+        t = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t)
+        counts = dict(fake_bpy.counters)
+    run = bench(fake_bpy.scene(**params))
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time': best, 'peak': peak, **counts}
+
+def case_key(name, params):
+    return f"{name}[loops={params['loops']},layers={params['layers']},objects={params['objects']}]"
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--full', action='store_true', help="sweep the full ranges (slow, needs several GB of RAM)")
+    ap.add_argument('--only', default='', help="comma separated benchmark names: " + ", ".join(BENCHMARKS))
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--save', metavar='FILE', help="write results as a JSON baseline")
+    ap.add_argument('--compare', metavar='FILE', help="diff against a JSON baseline")
+    ap.add_argument('--threshold', type=float, default=1.2, help="time or memory ratio flagged as a regression")
+    args = ap.parse_args(argv)
+    only = {n for n in args.only.split(',') if n}
+    if only - set(BENCHMARKS): ap.error(f"unknown benchmark(s): {', '.join(sorted(only - set(BENCHMARKS)))}")
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else {}
+    results, regressions = {}, 0
+    print(f"{'case':<52}{'time ms':>10}{'peak MB':>10}{'writes':>8}{'updates':>8}{'redraws':>8}" + ("   vs baseline" if baseline else ""))
+    for name, params in cases(FULL if args.full else QUICK, CAPS['full' if args.full else 'quick'], only):
+        key = case_key(name, params)
+        r = results[key] = measure(name, params, args.repeat)
+        line = f"{key:<52}{r['time'] * 1e3:>10.2f}{r['peak'] / 2**20:>10.1f}{r['uv_writes']:>8}{r['mesh_updates']:>8}{r['redraws']:>8}"
+        if key in baseline:
+            b = baseline[key]
+            dt, dm = r['time'] / max(b['time'], 1e-9), r['peak'] / max(b['peak'], 1)
+            flag = dt > args.threshold or dm > args.threshold
+            regressions += flag
+            line += f"   time x{dt:.2f}  mem x{dm:.2f}" + ("  REGRESSION" if flag else "")
+        print(line, flush=True)
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=1))
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""Load the add-on against the bpy stand-in from benchmarks/fake_bpy.py"""
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import fake_bpy
+
+bpy = fake_bpy.install()
+addon = fake_bpy.load_addon()
+
+@pytest.fixture
+def ctx():
+    """The fake context; build the scene with fake_bpy.scene after requesting it"""
+    fake_bpy.reset_counters()
+    bpy.app.background = False
+    bpy.context.preferences.addons.clear()
+    addon.selection_changed()
+    return bpy.context
+
+@pytest.fixture
+def prefs(ctx):
+    p = types.SimpleNamespace(profile=True, profile_file="", profile_capture=False)
+    ctx.preferences.addons[addon.__name__] = types.SimpleNamespace(preferences=p)
+    addon._profile_log.clear()
+    return p
+
+def event(kind):
+    return types.SimpleNamespace(type=kind)
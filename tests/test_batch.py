@@ -0,0 +1,96 @@
+import json
+import subprocess
+import types
+
+import pytest
+
+from conftest import addon, fake_bpy
+
+batch = addon.batch
+
+def job_dir(tmp_path, n=5):
+    (tmp_path / "assets").mkdir()
+    for i in range(n): (tmp_path / "assets" / f"a{i}.blend").touch()
+    spec = tmp_path / "job.toml"
+    spec.write_text('files = ["assets/*.blend"]\nworkers = 2\ntimeout = 5\n\n[[steps]]\nop = "delete_empty"\nmode = "DEGENERATE"\n\n'
+                    '[[steps]]\nop = "rename"\nnames = { map1 = "UVMap" }\n')
+    return spec
+
+def fake_worker(fail=(), slow=()):
+    calls = []
+    def work(path, job, timeout):
+        calls.append(path)
+        if any(path.endswith(f) for f in slow): raise subprocess.TimeoutExpired(path, timeout)
+        if any(path.endswith(f) for f in fail): return {'status': 'failed', 'error': "boom"}
+        return {'status': 'ok', 'steps': [{'op': s['op']} for s in job['steps']]}
+    return work, calls
+
+def test_load_job(tmp_path):
+    job = batch.load_job(job_dir(tmp_path))
+    assert [p.rsplit("/", 1)[-1] for p in job['files']] == [f"a{i}.blend" for i in range(5)]
+    assert job['workers'] == 2 and job['timeout'] == 5 and job['save'] and job['active'] is None
+    assert [s['op'] for s in job['steps']] == ['delete_empty', 'rename']
+
+@pytest.mark.parametrize('spec, error', [
+    ({'steps': [{'op': 'sort_maps'}]}, "'files'"),
+    ({'files': "*.blend"}, "'steps'"),
+    ({'files': "*.blend", 'steps': [{'op': 'explode'}]}, "unknown op"),
+    ({'files': "*.blend", 'steps': [{'op': 'sort_maps', 'mode': 'X'}]}, "does not take mode"),
+    ({'files': "*.blend", 'steps': [{'op': 'rename'}]}, "'names'"),
+    ({'files': "*.blend", 'steps': [{'op': 'sort_maps'}], 'workers': 0}, "'workers'"),
+    ({'files': "*.blend", 'steps': [{'op': 'sort_maps'}], 'colour': 1}, "unknown job key"),
+])
+def test_invalid_job(tmp_path, spec, error):
+    with pytest.raises(ValueError, match=error):
+        batch.parse_job(spec, tmp_path)
+
+def test_statuses_and_summary(tmp_path):
+    spec = job_dir(tmp_path)
+    job = batch.load_job(spec)
+    work, calls = fake_worker(fail=["a1.blend"], slow=["a3.blend"])
+    summary = batch.run_batch(job, work, tmp_path / "p.jsonl", log=lambda msg: None)
+    assert len(calls) == 5
+    assert (summary['ok'], summary['failed'], summary['timeout'], summary['skipped']) == (3, 1, 1, 0)
+    assert sorted(f.rsplit("/", 1)[-1] for f in summary['failures']) == ["a1.blend", "a3.blend"]
+    recs = [json.loads(l) for l in (tmp_path / "p.jsonl").read_text().splitlines()]
+    assert sorted(r['status'] for r in recs) == ['failed', 'ok', 'ok', 'ok', 'timeout']
+
+def test_resume_skips_finished_files(tmp_path):
+    job = batch.load_job(job_dir(tmp_path))
+    progress = tmp_path / "p.jsonl"
+    work, _ = fake_worker(fail=["a1.blend"])
+    batch.run_batch(job, work, progress, log=lambda msg: None)
+    with open(progress, 'a') as f: f.write('{"file": "torn')
+    work, calls = fake_worker()
+    summary = batch.run_batch(job, work, progress, log=lambda msg: None)
+    assert [c.rsplit("/", 1)[-1] for c in calls] == ["a1.blend"]
+    assert (summary['ok'], summary['skipped']) == (1, 4)
+    work, calls = fake_worker()
+    batch.run_batch(job, work, progress, restart=True, log=lambda msg: None)
+    assert len(calls) == 5
+
+def test_worker_exception_is_a_failure(tmp_path):
+    job = batch.load_job(job_dir(tmp_path, 1))
+    def work(path, job, timeout): raise OSError("no blender")
+    summary = batch.run_batch(job, work, tmp_path / "p.jsonl", log=lambda msg: None)
+    assert summary['failed'] == 1 and "OSError: no blender" in next(iter(summary['failures'].values()))
+
+def test_rename_maps_skips_collisions():
+    layers = [types.SimpleNamespace(name=n) for n in ("map1", "UVChannel_1", "Other")]
+    mesh = type('Mesh', (), {'uv_layers': layers})()
+    obj = types.SimpleNamespace(data=mesh)
+    assert batch.rename_maps([obj, obj], {"map1": "UVMap", "UVChannel_1": "UVMap"}) == 1
+    assert [l.name for l in layers] == ["UVMap", "UVChannel_1", "Other"]
+
+def test_run_steps_skips_steps_that_do_not_apply(ctx):
+    objs = fake_bpy.scene(100, 1, 1)
+    objs[0].data.uv_layers[0].data.arr[:] = 0
+    steps = [{'op': 'sort_maps'}, {'op': 'sync_names'}, {'op': 'rename', 'names': {'UVMap00': 'UVMap'}}, {'op': 'delete_empty'}]
+    addon.register()
+    try:
+        results = batch.run_steps(steps)
+    finally:
+        addon.unregister()
+    assert results == [{'op': 'sort_maps', 'skipped': True}, {'op': 'sync_names', 'skipped': True},
+                       {'op': 'rename', 'renamed': 1}, {'op': 'delete_empty', 'result': ['FINISHED']}]
+    assert not objs[0].data.uv_layers and ctx.selected_objects == objs
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from conftest import addon, fake_bpy
+
+@pytest.fixture
+def clip_dir(ctx, tmp_path, monkeypatch):
+    monkeypatch.setattr(fake_bpy, 'user_dir', str(tmp_path))
+    monkeypatch.setattr(addon, '_clipboard', None)
+    return tmp_path
+
+def run(cls, ctx, **props):
+    op = cls()
+    for k, v in props.items(): setattr(op, k, v)
+    return op, op.execute(ctx)
+
+def test_copy_maps_pastes_by_name_into_matching_topology(ctx, clip_dir):
+    objs = fake_bpy.scene(100, 4, 3)
+    src = objs[0].data
+    objs[1].data = fake_bpy.grid_mesh("Same", 100)
+    objs[2].data = fake_bpy.grid_mesh("Other", 400)
+    ctx.selected_objects = objs[:1]
+    op, res = run(addon.UV_OT_copy_maps, ctx, names="UVMap01, UVMap03")
+    assert res == {'FINISHED'}
+    assert addon.clipboard_header()['names'] == ["UVMap01", "UVMap03"]
+    ctx.selected_objects = objs
+    addon.selection_changed()
+    # A later session reads the files only
+    addon._clipboard = None
+    op, res = run(addon.UV_OT_paste_maps, ctx)
+    assert res == {'FINISHED'} and 'skipped 1' in op.reports[0][1]
+    same = objs[1].data
+    assert [l.name for l in same.uv_layers] == ["UVMap01", "UVMap03"]
+    for name in ("UVMap01", "UVMap03"):
+        np.testing.assert_array_equal(same.uv_layers[name].data.arr, src.uv_layers[name].data.arr)
+    assert not objs[2].data.uv_layers
+
+def test_edit_mode_copy_and_paste_selected_corners(ctx, clip_dir):
+    obj = fake_bpy.scene(100, 2, 1)[0]
+    obj.mode = 'EDIT'
+    layers = obj.data.uv_layers
+    layers.active.vertex_selection.arr[:10] = True
+    before = layers[0].data.arr.copy()
+    assert not addon.UV_OT_paste_uvs.poll(ctx)
+    assert run(addon.UV_OT_copy_uvs, ctx)[1] == {'FINISHED'}
+    assert addon.UV_OT_paste_uvs.poll(ctx)
+    layers[0].data.arr[:] = 0.5
+    layers.active_index = 1
+    run(addon.UV_OT_paste_uvs, ctx)
+    np.testing.assert_array_equal(layers[1].data.arr[:10], before[:10])
+    # Multi-map paste in Edit Mode adds missing maps to the edit mesh
+    layers.active_index = 0
+    run(addon.UV_OT_copy_maps, ctx)
+    layers.remove(layers[1])
+    op, res = run(addon.UV_OT_paste_maps, ctx)
+    assert res == {'FINISHED'} and [l.name for l in layers] == ["UVMap00", "UVMap01"]
+    np.testing.assert_array_equal(layers[0].data.arr[:10], 0.5)
+
+def test_torn_clipboard_is_ignored(ctx, clip_dir):
+    obj = fake_bpy.scene(100, 2, 1)[0]
+    run(addon.UV_OT_copy_maps, ctx)
+    np.save(addon.clipboard_path(1), np.zeros((1, 4), np.float32))
+    assert addon.load_clipboard() is None
+    op, res = run(addon.UV_OT_paste_maps, ctx)
+    assert res == {'CANCELLED'}
@@ -0,0 +1,30 @@
+from conftest import addon, fake_bpy
+
+def test_removes_later_copies_and_keeps_render(ctx):
+    objs = fake_bpy.scene(100, 4, 2)
+    layers = objs[0].data.uv_layers
+    layers[2].data.arr[:] = layers[0].data.arr
+    layers[3].data.arr[:] = layers[0].data.arr
+    layers[3].active_render = True
+    layers.active_index = 2
+    keep = layers[1].data.arr.copy()
+    op = addon.UV_OT_delete_duplicates()
+    op.execute(ctx)
+    assert [l.name for l in layers] == ["UVMap00", "UVMap01"]
+    assert layers[0].active_render and layers.active_index == 0
+    assert (layers[1].data.arr == keep).all()
+    assert len(objs[1].data.uv_layers) == 4
+    assert op.reports[-1][1].startswith("Deleted 2 duplicate UV map(s) on 2 mesh(es)")
+
+def test_find_only_and_across_selection(ctx):
+    objs = fake_bpy.scene(100, 2, 2)
+    a, b = objs[0].data.uv_layers, objs[1].data.uv_layers
+    a[1].data.arr[:] = a[0].data.arr
+    b[0].data.arr[:] = a[0].data.arr
+    op = addon.UV_OT_delete_duplicates()
+    op.mode, op.across = 'FIND', True
+    op.execute(ctx)
+    assert len(a) == 2
+    msg = op.reports[-1][1]
+    assert msg.startswith("Found 1 duplicate UV map(s)") and "1 map(s) also identical on another selected mesh" in msg
+    assert "Mesh0: UVMap01 = UVMap00" in msg
@@ -0,0 +1,27 @@
+from conftest import addon, fake_bpy
+
+def layer(uv):
+    mesh = fake_bpy.grid_mesh("Mesh", len(uv))
+    l = mesh.uv_layers._new("UVMap")
+    l.data.arr[:len(uv)] = uv
+    return l, len(mesh.loops)
+
+def test_origin():
+    l, n = layer([(0, 0)] * 400)
+    assert addon.is_uv_empty(l, n)
+    l.data.arr[n - 1] = (1e-4, 0)
+    assert not addon.is_uv_empty(l, n)
+    assert addon.is_uv_empty(l, n, eps=1e-3)
+
+def test_degenerate():
+    l, n = layer([(0.5, 0.25)] * 400)
+    assert not addon.is_uv_empty(l, n)
+    assert addon.is_uv_empty(l, n, degenerate=True)
+    l.data.arr[n // 2 + 1] = (0.5, 0.3)
+    assert not addon.is_uv_empty(l, n, degenerate=True)
+
+def test_used_map_rejected_without_bulk_read(monkeypatch):
+    l, n = layer([(0, 0)] + [(0.5, 0.5)] * (addon.EMPTY_CHUNK * 2 - 1))
+    monkeypatch.setattr(addon, 'read_uv', None)
+    assert not addon.is_uv_empty(l, n)
+    assert not addon.is_uv_empty(l, n, degenerate=True)
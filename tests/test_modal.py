@@ -0,0 +1,63 @@
+from conftest import addon, event, fake_bpy
+
+def run_modal(op, ctx, stop_after=None):
+    """Feed timer events to a running modal operator, Esc after stop_after ticks"""
+    ticks, result = 0, {'RUNNING_MODAL'}
+    while result == {'RUNNING_MODAL'}:
+        result = op.modal(ctx, event('ESC' if ticks == stop_after else 'TIMER'))
+        ticks += 1
+    return result
+
+def test_small_selection_runs_at_once(ctx):
+    objs = fake_bpy.scene(100, 2, 3)
+    objs[1].data.uv_layers[0].data.arr[:] = 0
+    assert addon.UV_OT_delete_empty().invoke(ctx, None) == {'FINISHED'}
+    assert len(objs[1].data.uv_layers) == 1
+
+def test_large_selection_goes_modal(ctx, monkeypatch):
+    monkeypatch.setattr(addon, 'MODAL_SLICE', 0)
+    objs = fake_bpy.scene(100, 2, addon.MODAL_MIN_MESHES)
+    for o in objs: o.data.uv_layers[0].data.arr[:] = 0
+    op = addon.UV_OT_delete_empty()
+    assert op.invoke(ctx, None) == {'RUNNING_MODAL'}
+    assert op.modal(ctx, event('MOUSEMOVE')) == {'PASS_THROUGH'}
+    assert op.modal(ctx, event('A')) == {'RUNNING_MODAL'}
+    assert run_modal(op, ctx) == {'FINISHED'}
+    assert all(len(o.data.uv_layers) == 1 for o in objs)
+    assert op.reports[-1][0] == {'INFO'}
+
+def test_esc_keeps_finished_meshes(ctx, monkeypatch):
+    monkeypatch.setattr(addon, 'MODAL_SLICE', 0)
+    objs = fake_bpy.scene(100, 2, addon.MODAL_MIN_MESHES)
+    for o in objs: o.data.uv_layers[0].data.arr[:] = 0
+    op = addon.UV_OT_delete_empty()
+    op.invoke(ctx, None)
+    assert run_modal(op, ctx, stop_after=3) == {'FINISHED'}
+    assert [len(o.data.uv_layers) for o in objs] == [1] * 3 + [2] * (len(objs) - 3)
+    level, msg = op.reports[-1]
+    assert level == {'WARNING'} and msg.startswith(f"Cancelled after 3 of {len(objs)}")
+
+def test_replace_confirms_then_goes_modal(ctx, monkeypatch):
+    monkeypatch.setattr(addon, 'MODAL_SLICE', 0)
+    objs = fake_bpy.scene(100, 3, addon.MODAL_MIN_MESHES)
+    for o in objs[1:]: o.data.uv_layers.remove(o.data.uv_layers[2])
+    op = addon.UV_OT_transfer()
+    op.mode = 'REP'
+    assert op.invoke(ctx, None) == {'RUNNING_MODAL'}
+    assert run_modal(op, ctx) == {'FINISHED'}
+    src = objs[0].data.uv_layers
+    for o in objs[1:]:
+        assert [l.name for l in o.data.uv_layers] == [l.name for l in src]
+        assert (o.data.uv_layers[2].data.arr == src[2].data.arr).all()
+
+def test_modal_run_is_profiled(ctx, prefs, monkeypatch):
+    monkeypatch.setattr(addon, 'MODAL_SLICE', 0)
+    objs = fake_bpy.scene(100, 2, addon.MODAL_MIN_MESHES)
+    op = addon.UV_OT_transfer()
+    op.mode = 'ALL'
+    op.invoke(ctx, None)
+    assert not addon._profile_log
+    run_modal(op, ctx)
+    rec = addon._profile_log[-1]
+    assert rec['op'] == "uv.transfer"
+    assert rec['meshes'] == len(objs) - 1 and rec['layers'] == 2 * (len(objs) - 1)
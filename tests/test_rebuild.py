@@ -0,0 +1,38 @@
+import numpy as np
+
+from conftest import addon, fake_bpy
+
+def uv_data(mesh):
+    return {l.name: l.data.arr.copy() for l in mesh.uv_layers}
+
+def test_move_last_of_20_up_writes_two_layers(ctx):
+    mesh = fake_bpy.scene(100, 20, 1)[0].data
+    layers = mesh.uv_layers
+    layers.active_index = 19
+    layers[19].active_render = True
+    before = uv_data(mesh)
+    fake_bpy.reset_counters()
+    op = addon.UV_OT_move()
+    op.direction = 'UP'
+    op.execute(ctx)
+    assert fake_bpy.counters['uv_writes'] == 2
+    assert [l.name for l in layers][17:] == ["UVMap17", "UVMap19", "UVMap18"]
+    assert layers.active.name == "UVMap19" and layers.active_index == 18
+    assert next(l.name for l in layers if l.active_render) == "UVMap19"
+    for name, arr in uv_data(mesh).items():
+        np.testing.assert_array_equal(arr, before[name])
+
+def test_remove_add_and_permute_keep_data_with_names(ctx):
+    mesh = fake_bpy.scene(100, 8, 1)[0].data
+    before = uv_data(mesh)
+    backup = addon.get_uv_backup(mesh)
+    new = np.full(len(mesh.loops) * 2, 0.25, dtype=np.float32)
+    backup["Added"], backup["Blank"] = new, None
+    names = ["UVMap05", "Added", "UVMap00", "UVMap07", "Blank", "UVMap02", "UVMap06"]
+    addon.rebuild_uvs(mesh, names, backup, 3)
+    assert [l.name for l in mesh.uv_layers] == names
+    assert mesh.uv_layers.active.name == "UVMap07"
+    after = uv_data(mesh)
+    for name in names:
+        expected = before.get(name, new.reshape(-1, 2) if name == "Added" else 0)
+        np.testing.assert_array_equal(after[name], np.broadcast_to(expected, after[name].shape))
@@ -0,0 +1,16 @@
+import types
+
+from conftest import addon, bpy
+
+def test_register_without_context_object(monkeypatch):
+    # Add-on enable runs register() with a restricted context that has no .object
+    monkeypatch.setattr(bpy, 'context', types.SimpleNamespace(preferences=bpy.context.preferences))
+    addon.register()
+    try:
+        assert addon.reset_caches in bpy.app.handlers.load_post
+        assert addon.selection_changed in bpy.app.handlers.depsgraph_update_post
+        assert bpy.msgbus.subscriptions
+    finally:
+        addon.unregister()
+    assert addon.reset_caches not in bpy.app.handlers.load_post
+    assert addon.selection_changed not in bpy.app.handlers.depsgraph_update_post
@@ -0,0 +1,33 @@
+import pytest
+
+from conftest import addon, fake_bpy
+
+def run(cls, ctx, **props):
+    op = cls()
+    for k, v in props.items(): setattr(op, k, v)
+    assert op.execute(ctx) == {'FINISHED'}
+    return op.reports[-1][1]
+
+def test_shared_mesh_moves_one_slot(ctx):
+    objs = fake_bpy.scene(100, 4, 3)
+    objs[1].data = objs[0].data
+    mesh = objs[0].data
+    mesh.uv_layers.active_index = 2
+    msg = run(addon.UV_OT_move, ctx, direction='UP')
+    assert [l.name for l in mesh.uv_layers] == ["UVMap00", "UVMap02", "UVMap01", "UVMap03"]
+    assert msg == "Moved UV map 'UVMap02' up on 2 mesh(es), 3 object(s)"
+
+@pytest.mark.parametrize('cls, expected', [
+    (addon.UV_OT_add, "Added UV map 'UVMap' on 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_remove, "Removed UV map 'UVMap00' from 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_duplicate, "Duplicated UV map 'UVMap00' as 'UVMap00.001' on 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_sort, "Sorted UV maps on 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_reverse, "Reversed UV map order on 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_delete_all, "Deleted all UV maps on 2 mesh(es), 3 object(s)"),
+    (addon.UV_OT_sync_order, "Synced UV map order on 1 mesh(es), 1 object(s)"),
+])
+def test_counts_in_report(ctx, cls, expected):
+    objs = fake_bpy.scene(100, 2, 3)
+    objs[1].data = objs[0].data
+    addon.selection_changed()
+    assert run(cls, ctx) == expected
@@ -0,0 +1,28 @@
+from conftest import addon, fake_bpy
+
+def test_summary_cached_until_depsgraph_update(ctx):
+    objs = fake_bpy.scene(100, 2, 4)
+    objs[3].data = objs[2].data
+    assert addon.selection_summary(ctx) == (4, 3, False)
+    for i in range(7): objs[1].data.uv_layers.new(f"Extra{i}")
+    assert addon.selection_summary(ctx) == (4, 3, False)
+    addon.selection_changed(None, None)
+    assert addon.selection_summary(ctx) == (4, 3, True)
+
+def test_summary_follows_context_selection(ctx):
+    objs = fake_bpy.scene(100, 2, 4)
+    assert addon.selection_summary(ctx) == (4, 4, False)
+    with ctx.temp_override(selected_objects=objs[:2]):
+        assert addon.selection_summary(ctx) == (2, 2, False)
+    assert addon.selection_summary(ctx) == (4, 4, False)
+    # Same count, new active object
+    for i in range(7): objs[1].data.uv_layers.new(f"Extra{i}")
+    ctx.object = objs[1]
+    assert addon.selection_summary(ctx) == (4, 4, True)
+
+def test_summary_refreshed_by_operators(ctx):
+    objs = fake_bpy.scene(100, 8, 2)
+    assert addon.selection_summary(ctx) == (2, 2, False)
+    addon.UV_OT_add().execute(ctx)
+    assert addon.selection_summary(ctx) == (2, 2, True)
+    assert addon.UV_OT_sync_order.poll(ctx)
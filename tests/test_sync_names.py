@@ -0,0 +1,18 @@
+from conftest import addon, fake_bpy
+
+def test_one_rebuild_per_mesh(ctx, monkeypatch):
+    objs = fake_bpy.scene(100, 1, 300)
+    for i, o in enumerate(objs):
+        o.data.uv_layers[0].name = f"Map{i % 10}"
+    rebuilds = []
+    rebuild = addon.rebuild_uvs
+    monkeypatch.setattr(addon, 'rebuild_uvs', lambda mesh, *a: rebuilds.append(mesh) or rebuild(mesh, *a))
+    op = addon.UV_OT_copy_unique()
+    op.execute(ctx)
+    assert len(rebuilds) == len(set(map(id, rebuilds))) == len(objs)
+    assert fake_bpy.counters['mesh_updates'] == len(objs)
+    assert fake_bpy.counters['uv_writes'] == 0
+    for i, o in enumerate(objs):
+        names = [l.name for l in o.data.uv_layers]
+        assert names[0] == f"Map{i % 10}" and sorted(names) == [f"Map{k}" for k in range(10)]
+    assert op.reports[-1][1].startswith(f"Added {9 * len(objs)} UV map(s)")
@@ -0,0 +1,30 @@
+from conftest import addon, fake_bpy
+
+def test_cached_until_geometry_update():
+    a, b = fake_bpy.grid_mesh("A", 400), fake_bpy.grid_mesh("B", 400)
+    assert addon.topology_key(a) == addon.topology_key(b)
+    # Same counts, different topology, as after Sort Elements or a script writing loops.vertex_index
+    b.loops.fields['vertex_index'][:4] = b.loops.fields['vertex_index'][:4][::-1]
+    addon.uv_data_changed(None, fake_bpy.depsgraph(fake_bpy.Object("B", b)))
+    assert addon.topology_key(a) != addon.topology_key(b)
+    assert b.session_uid in addon._topology_cache
+
+def test_uv_only_update_keeps_cache():
+    m = fake_bpy.grid_mesh("M", 400)
+    hit = addon.topology_key(m), addon._topology_cache[m.session_uid]
+    addon.uv_data_changed(None, fake_bpy.depsgraph(m, geometry=False))
+    assert addon._topology_cache[m.session_uid] is hit[1]
+
+def test_cleared_on_mode_change():
+    m = fake_bpy.grid_mesh("M", 400)
+    addon.topology_key(m)
+    addon.on_mode_change()
+    assert m.session_uid not in addon._topology_cache
+
+def test_not_cached_in_edit_mode():
+    m = fake_bpy.grid_mesh("M", 400)
+    m.is_editmode = True
+    key = addon.topology_key(m)
+    assert m.session_uid not in addon._topology_cache
+    m.loops.fields['vertex_index'][:4] = m.loops.fields['vertex_index'][:4][::-1]
+    assert addon.topology_key(m) != key
@@ -0,0 +1,15 @@
+from conftest import addon, fake_bpy
+
+def test_mixed_targets_read_each_source_layer_once(ctx, monkeypatch):
+    objs = fake_bpy.scene(400, 3, 3)
+    objs[2].data = fake_bpy.grid_mesh("LOD", 100)
+    reads = []
+    read_uv = addon.read_uv
+    monkeypatch.setattr(addon, 'read_uv', lambda layer, count: reads.append(layer) or read_uv(layer, count))
+    op = addon.UV_OT_transfer()
+    op.mode, op.method = 'ALL', 'NEAREST'
+    op.execute(ctx)
+    src = list(objs[0].data.uv_layers)
+    assert sorted(map(id, reads)) == sorted(map(id, src))
+    assert "1 projected" in op.reports[-1][1]
+    assert (objs[1].data.uv_layers[1].data.arr == src[1].data.arr).all()
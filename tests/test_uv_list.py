@@ -0,0 +1,101 @@
+import time
+import types
+
+import pytest
+
+from conftest import addon, bpy, fake_bpy
+
+def ui_list(**props):
+    ul = addon.MESH_UL_uvmaps_plus()
+    for k, v in props.items(): setattr(ul, k, v)
+    return ul
+
+def visible(ul, mesh):
+    flt, order = ul.filter_items(None, mesh, "uv_layers")
+    names = [l.name for l in mesh.uv_layers]
+    shown = [i for i, f in enumerate(flt) if f & ul.bitflag_filter_item]
+    if order: shown.sort(key=lambda i: order[i])
+    return [names[i] for i in shown], flt
+
+def test_flags_and_filters(ctx):
+    mesh = fake_bpy.scene(100, 10, 1)[0].data
+    mesh.uv_layers[3].data.arr[:] = 0
+    mesh.uv_layers[9].name = "Lightmap"
+    mesh.uv_layers[9].active_render = True
+    names, flt = visible(ui_list(), mesh)
+    assert len(names) == 10
+    assert [i for i, f in enumerate(flt) if f & addon.FLAG_EMPTY] == [3]
+    assert [i for i, f in enumerate(flt) if f & addon.FLAG_LOCKED] == [8, 9]
+    assert visible(ui_list(show_flag='EMPTY'), mesh)[0] == ["UVMap03"]
+    assert visible(ui_list(show_flag='RENDER'), mesh)[0] == ["Lightmap"]
+    assert visible(ui_list(show_flag='LOCKED', filter_name="light"), mesh)[0] == ["Lightmap"]
+    assert visible(ui_list(filter_name="uvmap0*"), mesh)[0] == [f"UVMap0{i}" for i in range(9)]
+    assert visible(ui_list(use_filter_sort_alpha=True), mesh)[0][0] == "Lightmap"
+    assert [l.name for l in mesh.uv_layers][0] == "UVMap00"
+
+def test_flags_cached_until_mesh_changes(ctx):
+    mesh = fake_bpy.scene(100, 3, 1)[0].data
+    first = addon.uv_flags(mesh)
+    mesh.uv_layers[0].data.arr[:] = 0
+    assert addon.uv_flags(mesh) is first
+    addon.uv_data_changed(None, fake_bpy.depsgraph(mesh))
+    assert addon.uv_flags(mesh)[0] & addon.FLAG_EMPTY
+
+def test_stats_values_and_hash_cache(ctx):
+    mesh = fake_bpy.grid_mesh("Grid", 400)
+    layer = mesh.uv_layers.new("UVMap")
+    layer.data.arr[:] = mesh.vertices.fields['co'][mesh.loops.fields['vertex_index'], :2]
+    mesh.uv_layers.new("Outside").data.arr[:] = layer.data.arr * 2
+    mesh.uv_layers.new("Empty")
+    addon.refresh_stats(mesh)
+    stats = {name: addon._uv_stats[(mesh.session_uid, name)][1] for name in ("UVMap", "Outside", "Empty")}
+    assert stats["UVMap"]['bounds'] == (0.0, 0.0, 1.0, 1.0)
+    assert stats["UVMap"]['coverage'] == pytest.approx(1.0) and stats["UVMap"]['outside'] == 0
+    assert not stats["UVMap"]['degenerate'] and stats["Empty"]['degenerate']
+    assert stats["Outside"]['outside'] == pytest.approx(0.75, abs=0.1)
+    # After an edit only changed maps are recomputed
+    addon.uv_data_changed(None, fake_bpy.depsgraph(mesh))
+    mesh.uv_layers["Empty"].data.arr[:] = layer.data.arr
+    addon.refresh_stats(mesh)
+    assert addon._uv_stats[(mesh.session_uid, "UVMap")][1] is stats["UVMap"]
+    assert not addon._uv_stats[(mesh.session_uid, "Empty")][1]['degenerate']
+
+def run_timer():
+    """Call the statistics timer until it stops, as Blender would"""
+    deadline = time.monotonic() + 10
+    while addon.stats_timer() is not None:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+def test_stats_computed_off_draw_path(ctx):
+    objs = fake_bpy.scene(100, 3, 2)
+    mesh, other = objs[0].data, objs[1].data
+    timers = bpy.app.timers.registered
+    timers.clear()
+    ul = ui_list(show_stats=True)
+    for m in (mesh, other): ul.filter_items(ctx, m, "uv_layers")
+    assert timers == [addon.stats_timer] and not addon.stats_current(mesh)
+    # One call reads at most STATS_JOBS maps for the worker
+    addon.stats_timer()
+    assert len(addon._stats_jobs) <= addon.STATS_JOBS
+    run_timer()
+    assert addon.stats_current(mesh) and addon.stats_current(other) and not addon._stats_queue
+    assert "Coverage" in addon.UV_OT_stats.description(ctx, types.SimpleNamespace(index=0))
+    timers.clear()
+    ul.filter_items(ctx, mesh, "uv_layers")
+    assert not timers
+    # An edit only invalidates the edited mesh
+    addon.uv_data_changed(None, fake_bpy.depsgraph(objs[0]))
+    assert not addon.stats_current(mesh) and addon.stats_current(other)
+
+def test_edit_during_job_reads_map_again(ctx):
+    mesh = fake_bpy.scene(100, 1, 1)[0].data
+    addon.queue_stats(mesh)
+    addon.stats_timer()
+    addon.uv_data_changed(None, fake_bpy.depsgraph(mesh))
+    mesh.uv_layers[0].data.arr[:] = 0
+    run_timer()
+    assert not addon.stats_current(mesh)
+    addon.queue_stats(mesh)
+    run_timer()
+    assert addon._uv_stats[(mesh.session_uid, "UVMap00")][1]['degenerate']